@@ -28,6 +28,7 @@ os.environ["HF_ENDPOINT"] = "https://hf-mirror.com"
 MIN_DURATION = 0.06  # 最小时间间隔（秒）
 SEARCH_WINDOW = 20   # 搜索窗口大小
 TIMEOUT_CHECK_INTERVAL = 0.5  # 超时检查间隔（秒）
+RESULT_SHM_SIZE = 4 * 1024 * 1024  # 结果共享内存大小（字节），超出时回退到队列传输
 
 # 完整语言列表 (Whisper支持的主要语言)
 LANGUAGES = {
@@ -27,6 +27,7 @@ class LrcParser:
         self.headers = []
         self.lines_text = []
         self.translations = {}
+        self.lines_timestamps = []
         
         content = content.lstrip('\ufeff')
         lines = content.splitlines()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""LRC 解析数据的共享内存打包工具
+
+主进程把解析结果（时间戳、头部、歌词行、翻译）打包成一段连续的二进制数据写入共享内存，
+工作进程按偏移表直接切片还原，避免每次提交任务都对大列表进行 pickle。
+
+布局（本机字节序）:
+    计数区    int64 x 5: 时间戳数, 头部数, 歌词行数, 翻译分组数, 字符串总数
+    时间戳    float64 x 时间戳数
+    翻译分组  int64 x 翻译分组数（歌词行号） + int64 x 翻译分组数（该行翻译条数）
+    偏移表    int64 x (字符串总数 + 1)，相对于文本区起点
+    文本区    所有字符串按 头部、歌词行、翻译 的顺序拼接的 UTF-8 数据
+"""
+from array import array
+from typing import Any, Dict, List, Tuple
+
+_INT = 'q'
+_FLOAT = 'd'
+_INT_SIZE = array(_INT).itemsize
+_FLOAT_SIZE = array(_FLOAT).itemsize
+
+
+def pack_lrc_payload(parser_data: Dict[str, Any], timestamps: List[float]) -> bytes:
+    """打包解析数据
+
+    Args:
+        parser_data: 包含 headers、lines_text、translations 的字典
+        timestamps: 每行的时间戳（秒），缺失为 -1
+
+    Returns:
+        打包后的二进制数据
+    """
+    headers = parser_data.get('headers', [])
+    lines_text = parser_data.get('lines_text', [])
+    translations = parser_data.get('translations', {})
+
+    trans_keys = sorted(translations)
+    trans_counts = [len(translations[k]) for k in trans_keys]
+    strings = list(headers) + list(lines_text)
+    for k in trans_keys:
+        strings.extend(translations[k])
+
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = array(_INT, [0])
+    total = 0
+    for b in encoded:
+        total += len(b)
+        offsets.append(total)
+
+    counts = array(_INT, [len(timestamps), len(headers), len(lines_text), len(trans_keys), len(strings)])
+    return b"".join((
+        counts.tobytes(),
+        array(_FLOAT, timestamps).tobytes(),
+        array(_INT, trans_keys).tobytes(),
+        array(_INT, trans_counts).tobytes(),
+        offsets.tobytes(),
+        b"".join(encoded),
+    ))
+
+
+def unpack_lrc_payload(buf) -> Tuple[Dict[str, Any], List[float]]:
+    """还原 pack_lrc_payload 打包的数据
+
+    Args:
+        buf: 打包数据（bytes 或 memoryview，如共享内存的 buf）
+
+    Returns:
+        (parser_data, timestamps) 元组
+    """
+    view = memoryview(buf)
+    pos = 0
+
+    def take(typecode, count, item_size):
+        nonlocal pos
+        arr = array(typecode)
+        arr.frombytes(view[pos:pos + count * item_size])
+        pos += count * item_size
+        return arr
+
+    n_ts, n_headers, n_lines, n_trans, n_strings = take(_INT, 5, _INT_SIZE)
+    timestamps = take(_FLOAT, n_ts, _FLOAT_SIZE).tolist()
+    trans_keys = take(_INT, n_trans, _INT_SIZE)
+    trans_counts = take(_INT, n_trans, _INT_SIZE)
+    offsets = take(_INT, n_strings + 1, _INT_SIZE)
+
+    text = bytes(view[pos:pos + offsets[-1]])
+    view.release()
+    strings = [text[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(n_strings)]
+
+    headers = strings[:n_headers]
+    lines_text = strings[n_headers:n_headers + n_lines]
+    translations = {}
+    cursor = n_headers + n_lines
+    for key, count in zip(trans_keys, trans_counts):
+        translations[key] = strings[cursor:cursor + count]
+        cursor += count
+
+    parser_data = {'headers': headers, 'lines_text': lines_text, 'translations': translations}
+    return parser_data, timestamps
@@ -3,9 +3,15 @@ import os
 import shutil
 import requests
 import threading
-from dataclasses import dataclass
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from typing import List, Dict, Optional, Callable
 
+# 安装了 hf_transfer 时启用 HuggingFace 多连接下载（必须在导入 huggingface_hub 之前设置）
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 # Try to import huggingface_hub for faster-whisper models
 try:
     from huggingface_hub import HfApi, hf_hub_download
@@ -53,8 +59,30 @@ class ModelManager:
         self.base_dir = base_dir
         if not os.path.exists(self.base_dir):
             os.makedirs(self.base_dir, exist_ok=True)
+        # (目录修改时间签名, 模型列表)，签名不变时跳过磁盘扫描
+        self._list_cache = None
             
+    def _scan_signature(self):
+        """模型目录及各 Faster-Whisper 子目录的修改时间
+
+        原版模型直接保存在 base_dir 下，Faster-Whisper 模型文件写入子目录，
+        子目录内的增删不会改变 base_dir 的修改时间，因此一并记录。
+        """
+        sig = []
+        for path in [self.base_dir] + [os.path.join(self.base_dir, f"faster-whisper-{name}")
+                                       for name in FASTER_WHISPER_MODELS]:
+            try:
+                sig.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
     def get_model_list(self) -> List[ModelInfo]:
+        signature = self._scan_signature()
+        if self._list_cache is not None and self._list_cache[0] == signature:
+            # 返回副本，调用方修改 is_downloaded 等字段不会影响缓存
+            return [replace(m) for m in self._list_cache[1]]
+
         models = []
         
         # Faster Whisper Models
@@ -90,7 +118,8 @@ class ModelManager:
                 is_downloaded=is_downloaded
             ))
             
-        return models
+        self._list_cache = (signature, models)
+        return [replace(m) for m in models]
 
     def _check_faster_whisper_integrity(self, path: str) -> bool:
         if not os.path.isdir(path):
@@ -105,6 +134,7 @@ class ModelManager:
     def delete_model(self, model_info: ModelInfo):
         if not model_info.is_downloaded:
             return
+        self._list_cache = None
             
         try:
             if os.path.isdir(model_info.local_path):
@@ -114,6 +144,12 @@ class ModelManager:
         except Exception as e:
             print(f"Error deleting model: {e}")
 
+# 原版 Whisper 模型分段并行下载的连接数，以及启用分段下载的最小文件大小
+PARALLEL_CONNECTIONS = 8
+PARALLEL_MIN_SIZE = 16 * 1024 * 1024
+# Faster-Whisper 仓库内多个文件同时下载的线程数
+HF_DOWNLOAD_WORKERS = 4
+
 class ModelDownloader:
     """Helper to download models with progress callback"""
     def __init__(self, model_info: ModelInfo, progress_callback: Optional[Callable[[int, str], None]] = None):
@@ -147,7 +183,7 @@ class ModelDownloader:
         self.stop_flag = True
 
     def _download_hf(self):
-        # Using huggingface_hub api to list files and download them one by one for progress
+        # Using huggingface_hub api to list files and download them concurrently, reporting per-file progress
         if not HAS_HF_HUB:
             raise ImportError("huggingface_hub not installed")
             
@@ -166,23 +202,8 @@ class ModelDownloader:
         
         total_files = len(files_to_download)
         
-        # Note: Proper size based progress is hard with snapshot_download without a custom tracker
-        # and listing all file sizes first is slow. We will use file count + per-file progress if possible
-        # Or just download file by file.
-        
-        for i, filename in enumerate(files_to_download):
-            if self.stop_flag: break
-            
-            if self.callback: 
-                self.callback(int((i / total_files) * 100), f"Downloading {filename}...")
-            
-            # Use requests to download for granular progress within file
-            # Get download URL
-            # Note: hf_hub_url gives us the url
-            # But wait, faster-whisper expects a specific directory structure.
-            # Using hf_hub_download is safer but lacks progress callback that is easy to hook.
-            # Let's try hf_hub_download with local_dir
-            
+        def fetch(filename):
+            if self.stop_flag: return
             try:
                 hf_hub_download(
                     repo_id=repo_id,
@@ -196,6 +217,22 @@ class ModelDownloader:
                     local_dir=target_dir,
                     local_dir_use_symlinks=False
                 )
+        
+        # 仓库内的文件（配置、词表、权重）并行下载，小文件不必排在大文件之后
+        # hf_hub_download 在每个线程中复用各自的 HTTP 会话
+        if self.callback: self.callback(0, f"Downloading {total_files} files...")
+        with ThreadPoolExecutor(max_workers=max(1, min(HF_DOWNLOAD_WORKERS, total_files))) as executor:
+            futures = {executor.submit(fetch, f): f for f in files_to_download}
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    future.result()
+                    if self.stop_flag: break
+                    if self.callback:
+                        self.callback(int((done / total_files) * 100), f"Downloaded {futures[future]}")
+            finally:
+                # 停止或出错时取消尚未开始的文件
+                for future in futures:
+                    future.cancel()
             
         if not self.stop_flag and self.callback:
             self.callback(100, "Download Complete")
@@ -209,6 +246,100 @@ class ModelDownloader:
         
         if self.callback: self.callback(0, "Connecting...")
         
+        # 先写入临时文件，全部完成后再改名，避免中断或出错时留下看似完整的模型文件
+        part = dest + ".part"
+        try:
+            # 服务器支持 Range 请求且文件较大时分段并行下载，否则单连接流式下载
+            total_size, accept_ranges = self._probe_url(url)
+            if accept_ranges and total_size >= PARALLEL_MIN_SIZE:
+                self._download_ranges(url, part, total_size)
+            else:
+                self._download_stream(url, part)
+        except BaseException:
+            self._remove_partial(part)
+            raise
+                        
+        if self.stop_flag:
+            # Cleanup partial
+            self._remove_partial(part)
+        else:
+            os.replace(part, dest)
+            if self.callback: self.callback(100, "Download Complete")
+
+    @staticmethod
+    def _remove_partial(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _probe_url(self, url):
+        """查询文件大小以及是否支持 Range 请求，失败时按不支持处理"""
+        try:
+            response = requests.head(url, allow_redirects=True, timeout=10)
+            if response.status_code != 200:
+                return 0, False
+            total_size = int(response.headers.get('content-length', 0))
+            accept_ranges = response.headers.get('accept-ranges', '').lower() == 'bytes'
+            return total_size, accept_ranges
+        except (requests.RequestException, ValueError):
+            return 0, False
+
+    def _download_ranges(self, url, dest, total_size):
+        """把文件切成 PARALLEL_CONNECTIONS 段，每段一个线程用 Range 请求写入各自的偏移"""
+        with open(dest, 'wb') as f:
+            f.truncate(total_size)
+        
+        part_size = -(-total_size // PARALLEL_CONNECTIONS)
+        ranges = [(start, min(start + part_size, total_size) - 1)
+                  for start in range(0, total_size, part_size)]
+        
+        downloaded = [0]
+        lock = threading.Lock()
+        errors = []
+        chunk_size = 1024 * 1024 # 1MB
+        
+        def fetch(start, end):
+            try:
+                headers = {"Range": f"bytes={start}-{end}"}
+                with requests.get(url, headers=headers, stream=True, timeout=10) as response:
+                    if response.status_code != 206:
+                        raise Exception(f"HTTP Error: {response.status_code}")
+                    with open(dest, 'r+b') as f:
+                        f.seek(start)
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            if self.stop_flag or errors:
+                                return
+                            if chunk:
+                                f.write(chunk)
+                                with lock:
+                                    downloaded[0] += len(chunk)
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=fetch, args=r, daemon=True) for r in ranges]
+        for t in threads:
+            t.start()
+        
+        # 由当前线程汇总进度，最多每 0.1 秒回调一次
+        last_percent = -1
+        for t in threads:
+            while t.is_alive():
+                t.join(timeout=0.1)
+                percent = int((downloaded[0] / total_size) * 100)
+                if percent != last_percent and self.callback:
+                    last_percent = percent
+                    self.callback(percent, f"Downloading... {percent}%")
+        
+        if self.stop_flag:
+            return
+        if errors:
+            raise errors[0]
+        if downloaded[0] != total_size:
+            raise Exception(f"Incomplete download: {downloaded[0]}/{total_size} bytes")
+
+    def _download_stream(self, url, dest):
+        """单连接流式下载"""
         response = requests.get(url, stream=True, timeout=10)
         total_size = int(response.headers.get('content-length', 0))
         
@@ -228,11 +359,3 @@ class ModelDownloader:
                     if total_size > 0 and self.callback:
                         percent = int((downloaded / total_size) * 100)
                         self.callback(percent, f"Downloading... {percent}%")
-                        
-        if self.stop_flag:
-            # Cleanup partial
-            try:
-                os.remove(dest)
-            except: pass
-        else:
-            if self.callback: self.callback(100, "Download Complete")
@@ -1,25 +1,28 @@
 # -*- coding: utf-8 -*-
 import os
+import importlib.util
 import re
+import sys
 import gc
+import time
 import torch
 import traceback
 import stable_whisper
-from multiprocessing import Queue, Event
+from queue import Empty
+from multiprocessing import Queue, Event, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Any
 
-from config import MIN_DURATION
+from config import MIN_DURATION, TIMEOUT_CHECK_INTERVAL
 from core.lrc_parser import LrcParser
 from core.lrc_aligner import LrcAligner
+from core.lrc_payload import unpack_lrc_payload
 from utils.time_utils import format_time
 from utils.logger import setup_logger
 
-try:
-    import faster_whisper
-    HAS_FASTER_WHISPER = True
-except ImportError:
-    HAS_FASTER_WHISPER = False
+# 只检查是否安装，真正的导入由 stable_whisper.load_faster_whisper 在需要时完成
+HAS_FASTER_WHISPER = importlib.util.find_spec("faster_whisper") is not None
 
 @dataclass
 class WorkerArgs:
@@ -35,6 +38,9 @@ class WorkerArgs:
     lrc_timestamps: List[float] = field(default_factory=list) # 传递行时间戳列表
     enable_force_calibration: bool = True
     enable_avg_distribution: bool = False
+    task_id: int = 0 # 任务编号，回传的每条消息都带上它，主进程据此丢弃旧任务的消息
+    lrc_shm_name: Optional[str] = None # 解析数据所在的共享内存，设置时忽略 lrc_parser_data 和 lrc_timestamps
+    lrc_shm_size: int = 0
 
 def get_attr(obj, key, default=None):
     if isinstance(obj, dict): return obj.get(key, default)
@@ -94,42 +100,133 @@ class ModelCache:
 # 全局模型缓存实例
 _model_cache = ModelCache()
 
-def daemon_worker(input_queue: Queue, result_queue: Queue, progress_queue: Queue, stop_event: Event):
-    """常驻后台的工作进程，监听任务队列并执行"""
+class ProgressReporter:
+    """进度消息合并器
+    
+    包装进度队列，状态文本立即发送；进度数值去重，并在 interval 秒内只发送一次，
+    期间的中间值只保留最新一个，由下一次发送或 flush() 补发。
+    消息格式为 (task_id, "P", 进度值) 或 (task_id, "S", 状态文本)。
+    """
+    
+    def __init__(self, queue: Queue, task_id: int = 0, interval: float = 0.05):
+        self.queue = queue
+        self.task_id = task_id
+        self.interval = interval
+        self._last_sent = None
+        self._last_time = 0.0
+        self._pending = None
+    
+    def put(self, msg: str):
+        """发送一条状态文本（与 Queue.put 接口一致，供 LrcAligner 等直接使用）"""
+        # 状态文本保持先后顺序，先补发挂起的进度
+        self.flush()
+        self.queue.put((self.task_id, "S", msg))
+    
+    def progress(self, value: int):
+        """发送进度值（0-100）"""
+        if value == self._last_sent:
+            self._pending = None
+            return
+        if time.monotonic() - self._last_time >= self.interval:
+            self._send(value)
+        else:
+            self._pending = value
+    
+    def flush(self):
+        """立即发送挂起的进度值"""
+        if self._pending is not None:
+            self._send(self._pending)
+    
+    def _send(self, value):
+        self.queue.put((self.task_id, "P", value))
+        self._last_sent = value
+        self._last_time = time.monotonic()
+        self._pending = None
+
+def attach_shared_memory(name: str) -> SharedMemory:
+    """附加到主进程创建的共享内存，不向 resource_tracker 登记
+    
+    共享内存由主进程创建并负责 unlink；Python 3.13 之前附加也会登记，
+    而登记项与主进程共用同一个 resource_tracker，事后注销会删掉主进程的登记，只能在附加时跳过。
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda res_name, rtype: None if rtype == "shared_memory" else register(res_name, rtype)
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+def put_success(result_queue: Queue, result_shm: Optional[SharedMemory], lrc_content: str, task_id: int = 0):
+    """发送成功结果
+    
+    结果写入共享内存，队列只传递字节长度；没有共享内存或结果超出容量时回退为直接通过队列传输。
+    
+    Args:
+        result_queue: 结果队列
+        result_shm: 主进程创建的结果共享内存，可为 None
+        lrc_content: 生成的 LRC 文本
+        task_id: 任务编号
+    """
+    if result_shm is not None:
+        data = lrc_content.encode('utf-8')
+        if len(data) <= result_shm.size:
+            result_shm.buf[:len(data)] = data
+            result_queue.put((task_id, "success_shm", len(data)))
+            return
+    result_queue.put((task_id, "success", lrc_content))
+
+def daemon_worker(input_queue: Queue, result_queue: Queue, progress_queue: Queue, stop_event: Event,
+                  exit_event: Event, result_shm_name: Optional[str] = None):
+    """常驻后台的工作进程，监听任务队列并执行，exit_event 置位后退出"""
     global _model_cache
     
     # 初始化日志
     logger = setup_logger("WorkerDaemon")
     logger.info("Daemon worker process started, waiting for tasks...")
     
-    while True:
+    result_shm = None
+    if result_shm_name:
+        try:
+            result_shm = attach_shared_memory(result_shm_name)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Result shared memory unavailable, falling back to queue: {e}")
+    
+    while not exit_event.is_set():
         try:
-            task = input_queue.get()
+            # 带超时等待任务，以便及时响应退出事件
+            try:
+                task = input_queue.get(timeout=TIMEOUT_CHECK_INTERVAL)
+            except Empty:
+                continue
+            if task is None:
+                # 主进程关闭时放入的唤醒项，回到循环开头检查 exit_event
+                continue
             
-            if task == "EXIT":
-                logger.info("Received EXIT signal. Shutting down daemon.")
-                _model_cache.clear(force=True)
-                break
-                
-            if isinstance(task, WorkerArgs):
-                logger.info("Received new task.")
-                stop_event.clear()
-                
-                # 执行任务
-                run_inference_task(task, result_queue, progress_queue, stop_event)
-                
-                # 任务结束后进行轻量级清理，但保留模型
-                gc.collect()
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
+            logger.info("Received new task.")
+            stop_event.clear()
+            
+            # 执行任务
+            run_inference_task(task, result_queue, progress_queue, stop_event, result_shm)
+            
+            # 任务结束后进行轻量级清理，但保留模型
+            gc.collect()
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
                     
         except Exception as e:
             logger.error(f"Daemon loop error: {traceback.format_exc()}")
             # 防止死循环，稍作休眠
-            import time
             time.sleep(1)
+    
+    logger.info("Received exit signal. Shutting down daemon.")
+    _model_cache.clear(force=True)
+    if result_shm is not None:
+        result_shm.close()
 
-def run_inference_task(args: WorkerArgs, result_queue: Queue, progress_queue: Queue, stop_event: Event):
+def run_inference_task(args: WorkerArgs, result_queue: Queue, progress_queue: Queue, stop_event: Event,
+                       result_shm: Optional[SharedMemory] = None):
     """执行单次推理任务"""
     global _model_cache
     
@@ -145,16 +242,28 @@ def run_inference_task(args: WorkerArgs, result_queue: Queue, progress_queue: Qu
     initial_prompt_input = args.initial_prompt_input
     model_dir = args.model_dir or os.path.join(os.getcwd(), "models")
     release_vram_flag = args.release_vram
+    progress_queue = ProgressReporter(progress_queue, args.task_id)
 
     try:
         logger.info(f"Worker started. Audio: {audio_path}, Model: {model_size}")
         
+        lrc_timestamps = args.lrc_timestamps
+        if args.lrc_shm_name:
+            # 解析数据通过共享内存传入，按偏移表还原
+            lrc_shm = attach_shared_memory(args.lrc_shm_name)
+            payload = lrc_shm.buf[:args.lrc_shm_size]
+            try:
+                lrc_parser_data, lrc_timestamps = unpack_lrc_payload(payload)
+            finally:
+                payload.release()
+                lrc_shm.close()
+        
         # 恢复解析器状态
         parser = LrcParser()
         parser.headers = lrc_parser_data.get('headers', [])
         parser.lines_text = lrc_parser_data.get('lines_text', [])
         parser.translations = lrc_parser_data.get('translations', {})
-        parser.lines_timestamps = args.lrc_timestamps
+        parser.lines_timestamps = lrc_timestamps
         
         local_model_path = model_dir
         os.makedirs(local_model_path, exist_ok=True)
@@ -194,7 +303,7 @@ def run_inference_task(args: WorkerArgs, result_queue: Queue, progress_queue: Qu
                 use_faster = False
                 if HAS_FASTER_WHISPER and not stop_event.is_set():
                     progress_queue.put(f"🚀 加载 Faster-Whisper ({model_size})...")
-                    progress_queue.put("PROGRESS:10")
+                    progress_queue.progress(10)
                     try:
                         # 尝试使用本地下载的模型路径
                         faster_whisper_path = os.path.join(local_model_path, f"faster-whisper-{model_size}")
@@ -218,7 +327,7 @@ def run_inference_task(args: WorkerArgs, result_queue: Queue, progress_queue: Qu
                 
                 if not model and not stop_event.is_set():
                     progress_queue.put(f"加载标准模型 ({model_size})...")
-                    progress_queue.put("PROGRESS:10")
+                    progress_queue.progress(10)
                     model = stable_whisper.load_model(model_size, download_root=local_model_path, device=device)
                 
                 # 更新缓存
@@ -232,10 +341,10 @@ def run_inference_task(args: WorkerArgs, result_queue: Queue, progress_queue: Qu
         lang_param = language 
         # 移除 Auto 检测逻辑，因为 UI 已经强制选择了语言
         
-        progress_queue.put("PROGRESS:30")
+        progress_queue.progress(30)
         result = None
         if stop_event.is_set():
-            result_queue.put(("aborted", None))
+            result_queue.put((args.task_id, "aborted", None))
             return
         
         if ref_text and ref_text.strip():
@@ -256,6 +365,7 @@ def run_inference_task(args: WorkerArgs, result_queue: Queue, progress_queue: Qu
             # result = model.align(audio_path, spaced_ref_text, **align_args)
             
             # 如果是 faster-whisper，align 方法参数可能略有不同，但 stable-whisper 做了封装
+            progress_queue.flush()
             result = model.align(audio_path, spaced_ref_text, **align_args)
         else:
             progress_queue.put("正在进行语音识别...")
@@ -265,14 +375,15 @@ def run_inference_task(args: WorkerArgs, result_queue: Queue, progress_queue: Qu
             if hasattr(model, "model") and "FasterWhisper" in str(type(model.model)): # Check if faster whisper
                  transcribe_args["beam_size"] = 5
             
+            progress_queue.flush()
             result = model.transcribe(audio_path, **transcribe_args)
         
         if stop_event.is_set():
-            result_queue.put(("aborted", None))
+            result_queue.put((args.task_id, "aborted", None))
             return
         
         progress_queue.put("正在合成结果...")
-        progress_queue.put("PROGRESS:90")
+        progress_queue.progress(90)
         
         aligner = LrcAligner(
             parser, 
@@ -283,21 +394,22 @@ def run_inference_task(args: WorkerArgs, result_queue: Queue, progress_queue: Qu
         lrc_content = aligner.run(result, stop_event, progress_queue)
         
         if stop_event.is_set():
-            result_queue.put(("aborted", None))
+            result_queue.put((args.task_id, "aborted", None))
         else:
-            result_queue.put(("success", lrc_content))
-            progress_queue.put("PROGRESS:100")
+            put_success(result_queue, result_shm, lrc_content, args.task_id)
+            progress_queue.progress(100)
             logger.info("Task completed successfully.")
 
     except torch.cuda.OutOfMemoryError:
         logger.error("OOM Error")
-        result_queue.put(("error", "❌ 显存不足！请尝试更小的模型"))
+        result_queue.put((args.task_id, "error", "❌ 显存不足！请尝试更小的模型"))
         _model_cache.clear(force=True)
     except Exception as e:
         if not stop_event.is_set():
             logger.error(f"Error: {traceback.format_exc()}")
-            result_queue.put(("error", f"错误: {str(e)}"))
+            result_queue.put((args.task_id, "error", f"错误: {str(e)}"))
     finally:
+        progress_queue.flush()
         # 根据设置决定是否释放显存
         if release_vram_flag:
             _model_cache.clear(force=True)
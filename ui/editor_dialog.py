@@ -2,14 +2,147 @@
 import os
 import re
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-                             QSlider, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QStyle, QMessageBox)
-from PyQt6.QtCore import Qt, QTimer, QUrl
+                             QSlider, QTableView, QHeaderView, QAbstractItemView, QStyle, QMessageBox)
+from PyQt6.QtCore import Qt, QTimer, QUrl, QAbstractTableModel, QModelIndex
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QColor, QBrush
 
 from utils.time_utils import format_ms, parse_time_tag
 from ui.word_editor import WordLevelEditor
 
+# 行内任意时间戳
+_INNER_TS_RE = re.compile(r'\[\d{2}:\d{2}\.\d{2,3}\]')
+
+
+def _split_lrc_line(line):
+    """拆分 "[mm:ss.xx]内容" 格式的行
+    
+    时间戳格式固定，直接按字符位置校验，无需正则匹配。
+    
+    Args:
+        line: 已去除首尾空白的行文本
+        
+    Returns:
+        (时间戳, 内容) 元组；不是时间戳行时返回 None
+    """
+    if len(line) < 10 or line[0] != '[' or line[3] != ':' or line[6] != '.':
+        return None
+    end = line.find(']', 9, 11)
+    if end == -1 or not (line[1:3] + line[4:6] + line[7:end]).isdecimal():
+        return None
+    return line[:end + 1], line[end + 1:]
+
+
+def _first_inner_tag(text):
+    """查找行内第一个 [mm:ss.xx] 时间戳并返回其毫秒数
+    
+    逐个检查 '[' 出现的位置，按固定字符偏移校验格式，不进入正则引擎。
+    
+    Args:
+        text: 歌词内容
+        
+    Returns:
+        第一个合法时间戳的毫秒数；不存在时返回 None
+    """
+    i = text.find('[')
+    while i != -1:
+        if text[i + 3:i + 4] == ':' and text[i + 6:i + 7] == '.':
+            end = text.find(']', i + 9, i + 11)
+            if end != -1 and (text[i + 1:i + 3] + text[i + 4:i + 6] + text[i + 7:end]).isdecimal():
+                return parse_time_tag(text[i:end + 1])
+        i = text.find('[', i + 1)
+    return None
+
+
+class LrcTableModel(QAbstractTableModel):
+    """歌词表格数据模型
+    
+    每行存储为 [时间戳, 歌词内容] 两个字符串，不为单元格创建额外的包装对象。
+    """
+    HEADERS = ["时间戳", "歌词内容"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._highlighted = set()  # 当前高亮（正在播放）的行
+        self._highlight_bg = QBrush(QColor("#e6f7ff"))  # 淡蓝色背景
+        self._highlight_fg = QBrush(QColor("#1890ff"))  # 深蓝色文字
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._rows[index.row()][index.column()]
+        if index.row() in self._highlighted:
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self._highlight_bg
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._highlight_fg
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = value
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, rows):
+        """整体替换表格数据，只触发一次模型重置"""
+        self.beginResetModel()
+        self._rows = [list(r) for r in rows]
+        self._highlighted.clear()
+        self.endResetModel()
+
+    def rows(self):
+        """返回所有行 ((时间戳, 歌词内容), ...) 的只读副本，修改请走 set_text"""
+        return tuple(tuple(r) for r in self._rows)
+
+    def column(self, col):
+        """逐行返回指定列的文本，不复制数据"""
+        return (r[col] for r in self._rows)
+
+    def text(self, row, col):
+        return self._rows[row][col]
+
+    def set_text(self, row, col, text):
+        """原地修改单元格文本并通知视图刷新"""
+        if self._rows[row][col] == text:
+            return
+        self._rows[row][col] = text
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+
+    def set_row_highlight(self, row, is_playing):
+        """设置行高亮状态，只刷新该行"""
+        if is_playing:
+            if row in self._highlighted:
+                return
+            self._highlighted.add(row)
+        else:
+            if row not in self._highlighted:
+                return
+            self._highlighted.discard(row)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, 1),
+                              [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ForegroundRole])
+
+
 class LrcEditorDialog(QDialog):
     def __init__(self, audio_path, lrc_content, parent=None):
         super().__init__(parent)
@@ -27,15 +160,31 @@ class LrcEditorDialog(QDialog):
         self.cached_timestamps = []  # 缓存解析后的时间戳 [(row, time_ms), ...]
         self.last_highlight_row = -1  # 记录上次高亮的行
         self.translation_rows = set()  # 记录翻译行的索引
+        self._time_groups = {}  # 时间戳字符串 -> 使用该时间戳的行号集合
+        self._last_shown_ms = -1  # 上次刷新进度显示时的位置 (10ms 粒度)
         
         self.setup_ui()
         self.load_lrc_data()
-        self.load_audio()
-        
-        self.timer = QTimer(self)
-        self.timer.setInterval(100)
-        self.timer.timeout.connect(self.update_progress)
-        self.timer.start()
+        # 音频探测可能阻塞，推迟到对话框首次绘制之后再加载
+        self._audio_loaded = False
+        QTimer.singleShot(0, self.load_audio)
+        
+        # 由播放器位置变化驱动进度刷新，暂停时不再空转
+        self.player.positionChanged.connect(self.update_progress)
+        
+        # 拖动进度条时合并 seek 请求，只把最后的位置发给播放器
+        self._pending_pos = None
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(40)
+        self._seek_timer.timeout.connect(self._do_seek)
+        
+        # 连续按 Enter 时每行的打点先记录下来，稍后一次性写入模型
+        self._pending_stamps = {}  # row -> 播放位置 (ms)
+        self._stamp_timer = QTimer(self)
+        self._stamp_timer.setSingleShot(True)
+        self._stamp_timer.setInterval(10)
+        self._stamp_timer.timeout.connect(self._apply_stamp)
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -71,20 +220,25 @@ class LrcEditorDialog(QDialog):
         
         layout.addLayout(preview_container)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["时间戳", "歌词内容"])
+        self.model = LrcTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
         
-        self.table.cellDoubleClicked.connect(self.seek_to_row)
-        self.table.cellPressed.connect(self.pause_on_click)
+        self.table.doubleClicked.connect(self.on_row_double_clicked)
+        self.table.pressed.connect(self.pause_on_click)
         layout.addWidget(self.table)
         
         ctrl_box = QHBoxLayout()
+        # 缓存播放/暂停图标，避免每次切换都重新获取
+        style = self.style()
+        self._icon_play = style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay)
+        self._icon_pause = style.standardIcon(QStyle.StandardPixmap.SP_MediaPause)
         self.btn_play = QPushButton()
+        self.btn_play.setEnabled(False)  # 音频加载完成后启用
         self.update_play_icon()
         self.btn_play.clicked.connect(self.toggle_play)
         
@@ -124,49 +278,49 @@ class LrcEditorDialog(QDialog):
 
     def load_audio(self):
         if self.audio_path and os.path.exists(self.audio_path):
-            self.player.setSource(QUrl.fromLocalFile(self.audio_path))
             self.player.mediaStatusChanged.connect(self.on_media_status)
+            self.player.setSource(QUrl.fromLocalFile(self.audio_path))
     
     def on_media_status(self, status):
         if status == QMediaPlayer.MediaStatus.LoadedMedia:
+            self._audio_loaded = True
+            self.btn_play.setEnabled(True)
             duration = self.player.duration()
             self.slider.setRange(0, duration)
             self.lbl_total.setText(format_ms(duration))
 
     def load_lrc_data(self):
         lines = self.lrc_content.splitlines()
-        self.table.setRowCount(0)
         self.translation_rows.clear()
-        pattern = re.compile(r'^(\[\d{2}:\d{2}\.\d{2,3}\])(.*)')
-        row = 0
         last_timestamp = None
-        
+
+        # 先解析为 (时间戳, 内容, 是否翻译行) 列表，再一次性填充表格，
+        # 避免逐行 insertRow 触发大量模型更新信号
+        parsed_rows = []
         for line in lines:
             line = line.strip()
             if not line: continue
-            match = pattern.match(line)
-            if match:
-                timestamp = match.group(1)
-                content = match.group(2)
-                
-                self.table.insertRow(row)
-                
+            split = _split_lrc_line(line)
+            if split:
+                timestamp, content = split
+
                 # 检测翻译行（时间戳相同且不是第一次出现）
-                if timestamp == last_timestamp and row > 0:
-                    self.translation_rows.add(row)
+                is_translation = timestamp == last_timestamp and len(parsed_rows) > 0
+                if is_translation:
                     # 翻译行添加图标标记
                     content = f"🌐 {content}"
-                
-                self.table.setItem(row, 0, QTableWidgetItem(timestamp))
-                self.table.setItem(row, 1, QTableWidgetItem(content))
+
+                parsed_rows.append((timestamp, content, is_translation))
                 last_timestamp = timestamp
-                row += 1
             else:
-                self.table.insertRow(row)
-                self.table.setItem(row, 0, QTableWidgetItem(""))
-                self.table.setItem(row, 1, QTableWidgetItem(line))
-                row += 1
-        
+                parsed_rows.append(("", line, False))
+
+        for row, (_, _, is_translation) in enumerate(parsed_rows):
+            if is_translation:
+                self.translation_rows.add(row)
+        self.last_highlight_row = -1
+        self.model.set_rows((timestamp, content) for timestamp, content, _ in parsed_rows)
+
         # 新增：加载完成后缓存时间戳
         self.cache_timestamps()
 
@@ -182,9 +336,10 @@ class LrcEditorDialog(QDialog):
             # Ctrl+Right: 时间戳 +100ms
             self.adjust_timestamp(100)
         else:
-            QTableWidget.keyPressEvent(self.table, event)
+            QTableView.keyPressEvent(self.table, event)
 
     def toggle_play(self):
+        if not self._audio_loaded: return
         if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
             self.player.pause()
         else:
@@ -192,16 +347,22 @@ class LrcEditorDialog(QDialog):
         self.update_play_icon()
 
     def update_play_icon(self):
-        style = self.style()
         if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-            icon = style.standardIcon(QStyle.StandardPixmap.SP_MediaPause)
+            self.btn_play.setIcon(self._icon_pause)
         else:
-            icon = style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay)
-        self.btn_play.setIcon(icon)
+            self.btn_play.setIcon(self._icon_play)
 
-    def update_progress(self):
-        pos = self.player.position()
-        self.slider.setValue(pos)
+    def update_progress(self, pos):
+        # 拖动进度条时由 set_position 负责刷新，避免滑块回跳
+        if self.slider.isSliderDown():
+            return
+        # 以 10ms 为粒度，位置未变化时跳过刷新
+        bucket = pos // 10
+        if bucket == self._last_shown_ms:
+            return
+        self._last_shown_ms = bucket
+        if self.slider.value() != pos:
+            self.slider.setValue(pos)
         self.lbl_curr.setText(format_ms(pos))
         
         if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
@@ -214,49 +375,55 @@ class LrcEditorDialog(QDialog):
             self.update_line_preview(pos)
 
     def set_position(self, pos):
-        self.player.setPosition(pos)
+        self._pending_pos = pos
+        self._seek_timer.start()
         self.lbl_curr.setText(format_ms(pos))
         
         # 新增：拖拽时也更新预览和高亮
         self.update_line_preview(pos)
         self.highlight_current_line(pos)
 
+    def _do_seek(self):
+        """执行合并后的 seek 请求"""
+        self._seek_timer.stop()
+        if self._pending_pos is not None:
+            self.player.setPosition(self._pending_pos)
+            self._pending_pos = None
+
     def pause_for_seek(self):
         self.was_playing = (self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState)
         self.player.pause()
+        self.audio_output.setMuted(True)
 
     def resume_after_seek(self):
+        # 松开滑块时立即应用最后一次拖动的位置
+        self._do_seek()
+        self.audio_output.setMuted(False)
         if hasattr(self, 'was_playing') and self.was_playing:
             self.player.play()
             self.update_play_icon()
     
+    def on_row_double_clicked(self, index):
+        self.seek_to_row(index.row(), index.column())
+
     def seek_to_row(self, row, col):
         """
         双击进入逐字编辑模式
         """
         # 获取当前行的时间和文本
-        time_item = self.table.item(row, 0)
-        text_item = self.table.item(row, 1)
-        
-        if not time_item or not text_item: return
-        
-        time_str = time_item.text()
-        text_content = text_item.text()
+        time_str = self.model.text(row, 0)
+        text_content = self.model.text(row, 1)
         start_ms = parse_time_tag(time_str)
         
         # === 关键：计算本句的结束时间 (下一句的开始时间) ===
         end_ms = self.player.duration() # 默认为歌曲总时长
-        next_row = row + 1
         
-        # 寻找下一个有效的时间戳作为结束时间
-        while next_row < self.table.rowCount():
-            next_time_item = self.table.item(next_row, 0)
-            if next_time_item:
-                next_start_ms = parse_time_tag(next_time_item.text())
-                if next_start_ms > start_ms: # 确保下一句时间确实比这句晚
+        # 按行顺序向后寻找第一个确实晚于本句的时间戳作为结束时间；本句无时间戳时以歌曲总时长为准
+        if start_ms >= 0:
+            for _, next_start_ms in self.cached_timestamps[row + 1:]:
+                if next_start_ms > start_ms:
                     end_ms = next_start_ms
                     break
-            next_row += 1
         # =================================================
         
         # 暂停主播放器
@@ -270,29 +437,47 @@ class LrcEditorDialog(QDialog):
         if editor.exec():
             # 保存逻辑
             if editor.result_start_time:
-                self.table.setItem(row, 0, QTableWidgetItem(editor.result_start_time))
+                self.model.set_text(row, 0, editor.result_start_time)
             if editor.result_lrc_content:
-                self.table.setItem(row, 1, QTableWidgetItem(editor.result_lrc_content))
+                self.model.set_text(row, 1, editor.result_lrc_content)
+            self.cache_timestamps()
+            self.refresh_preview()
     
-    def pause_on_click(self, row, col):
+    def pause_on_click(self, index):
         if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
             self.player.pause()
             self.update_play_icon()
 
     def stamp_current_time(self):
-        current_rows = self.table.selectedItems()
-        if not current_rows: return
-        
-        row = current_rows[0].row()
-        current_pos_ms = self.player.position()
+        row = self.table.currentIndex().row()
+        if row < 0: return
+        self._pending_stamps[row] = self.player.position()
+        # 立即选中下一行，连续快速按 Enter 时每次都落在新的一行上；模型写入延后合并执行
+        if row < self.model.rowCount() - 1:
+            self.table.selectRow(row + 1)
+            self.table.scrollTo(self.model.index(row + 1, 0))
+        self._stamp_timer.start()
+
+    def _apply_stamp(self):
+        """将所有等待中的打点按行顺序写入模型"""
+        if not self._pending_stamps:
+            return
+        pending = sorted(self._pending_stamps.items())
+        self._pending_stamps.clear()
+        for row, current_pos_ms in pending:
+            self._apply_stamp_to_row(row, current_pos_ms)
+        # 整批写入完成后只重建一次时间戳缓存
+        self.cache_timestamps()
+        self.refresh_preview()
+
+    def _apply_stamp_to_row(self, row, current_pos_ms):
+        """将播放位置写入指定行，并平移该行的字级时间戳"""
         new_time_str = f"[{format_ms(current_pos_ms)}]"
         
-        old_time_item = self.table.item(row, 0)
-        old_time_str = old_time_item.text()
+        old_time_str = self.model.text(row, 0)
         old_start_ms = parse_time_tag(old_time_str)
         
-        lyric_item = self.table.item(row, 1)
-        original_text = lyric_item.text()
+        original_text = self.model.text(row, 1)
         
         delta_ms = 0
         if old_start_ms >= 0:
@@ -300,59 +485,60 @@ class LrcEditorDialog(QDialog):
 
         # 修复首字异常空隙
         extra_fix_ms = 0
-        first_inner_match = re.search(r'\[(\d{2}:\d{2}\.\d{2,3})\]', original_text)
-        if first_inner_match and old_start_ms >= 0:
-            old_first_inner_ms = parse_time_tag(f"[{first_inner_match.group(1)}]")
+        old_first_inner_ms = _first_inner_tag(original_text)
+        if old_first_inner_ms is not None and old_start_ms >= 0:
             original_gap = old_first_inner_ms - old_start_ms
             if original_gap > 1200:
                 target_gap = 300
                 extra_fix_ms = -(original_gap - target_gap)
 
-        self.table.setItem(row, 0, QTableWidgetItem(new_time_str))
+        self.model.set_text(row, 0, new_time_str)
         
         total_shift_ms = delta_ms + extra_fix_ms
         shifted_text = self.shift_timestamps_in_string(original_text, total_shift_ms)
-        self.table.setItem(row, 1, QTableWidgetItem(shifted_text))
+        if shifted_text != original_text:
+            self.model.set_text(row, 1, shifted_text)
         
-        # 同步更新后续翻译行
+        # 同步更新后续翻译行（紧随其后且时间戳相同的行）
+        same_time_rows = self._time_groups.get(old_time_str, set())
         next_row = row + 1
-        while next_row < self.table.rowCount():
-            next_time_item = self.table.item(next_row, 0)
-            if not next_time_item: break
-            if next_time_item.text() == old_time_str:
-                self.table.setItem(next_row, 0, QTableWidgetItem(new_time_str))
-                next_row += 1
-            else:
-                break
-        
-        # 新增：修改时间戳后重新缓存
-        self.cache_timestamps()
+        while next_row in same_time_rows:
+            self.model.set_text(next_row, 0, new_time_str)
+            next_row += 1
         
-        if row < self.table.rowCount() - 1:
-            self.table.selectRow(row + 1)
-            self.table.scrollToItem(self.table.item(row + 1, 0))
+        # 同批次后续行依赖分组查找翻译行，这里就地更新分组，时间戳缓存由 _apply_stamp 统一重建
+        moved = range(row, next_row)
+        same_time_rows.difference_update(moved)
+        self._time_groups.setdefault(new_time_str, set()).update(moved)
 
     def shift_timestamps_in_string(self, text, delta_ms):
-        def replace_func(match):
-            full_tag = match.group(0)
-            ms = parse_time_tag(full_tag)
-            if ms < 0: return full_tag
-            new_ms = max(0, ms + delta_ms)
-            return f"[{format_ms(new_ms)}]"
-        
-        pattern = re.compile(r'\[\d{2}:\d{2}\.\d{2,3}\]')
-        return pattern.sub(replace_func, text)
+        """将字符串内所有时间戳整体平移 delta_ms 毫秒"""
+        if delta_ms == 0:
+            return text
+        tags = set(_INNER_TS_RE.findall(text))
+        if not tags:
+            return text
+        
+        # 每个不同的时间戳只换算一次，重复出现的标签直接查表替换
+        table = {}
+        for tag in tags:
+            ms = parse_time_tag(tag)
+            table[tag] = tag if ms < 0 else f"[{format_ms(max(0, ms + delta_ms))}]"
+        return _INNER_TS_RE.sub(lambda m: table[m.group(0)], text)
 
     def save_lrc(self):
-        lines = []
-        for r in range(self.table.rowCount()):
-            t = self.table.item(r, 0).text()
-            c = self.table.item(r, 1).text()
-            lines.append(f"{t}{c}")
-        self.result_lrc = "\n".join(lines)
+        # 尚未应用的同步写入先落地，避免保存旧时间戳
+        self._stamp_timer.stop()
+        self._apply_stamp()
+        self.result_lrc = "\n".join(t + c for t, c in self.model.rows())
         self.accept()
     
     def stop_and_release(self):
+        # 断开进度刷新，避免对话框关闭后仍在后台刷新预览
+        try:
+            self.player.positionChanged.disconnect(self.update_progress)
+        except TypeError:
+            pass
         if self.player.playbackState() != QMediaPlayer.PlaybackState.StoppedState:
             self.player.stop()
 
@@ -367,10 +553,12 @@ class LrcEditorDialog(QDialog):
     def cache_timestamps(self):
         """缓存所有行的时间戳（毫秒），优化查找性能"""
         self.cached_timestamps = []
-        for row in range(self.table.rowCount()):
-            time_item = self.table.item(row, 0)
-            if time_item and time_item.text():
-                ms = parse_time_tag(time_item.text())
+        self._time_groups = {}
+        for row, time_str in enumerate(self.model.column(0)):
+            # 同一时间戳字符串的行归为一组（原文行 + 翻译行）
+            self._time_groups.setdefault(time_str, set()).add(row)
+            if time_str:
+                ms = parse_time_tag(time_str)
                 self.cached_timestamps.append((row, ms))
             else:
                 self.cached_timestamps.append((row, -1))
@@ -421,7 +609,7 @@ class LrcEditorDialog(QDialog):
                 # 同时高亮翻译行
                 self.highlight_translation_rows(target_row, True)
                 # 自动滚动到当前行
-                self.table.scrollToItem(self.table.item(target_row, 0))
+                self.table.scrollTo(self.model.index(target_row, 0))
             
             self.last_highlight_row = target_row
     
@@ -431,19 +619,14 @@ class LrcEditorDialog(QDialog):
             return
         
         # 获取原文行的时间戳
-        time_item = self.table.item(original_row, 0)
-        if not time_item:
-            return
-        
-        original_timestamp = time_item.text()
+        original_timestamp = self.model.text(original_row, 0)
         
         # 查找所有相同时间戳的翻译行
-        for row in range(original_row + 1, self.table.rowCount()):
+        for row in range(original_row + 1, self.model.rowCount()):
             if row not in self.translation_rows:
                 break  # 遇到非翻译行，停止查找
             
-            trans_time_item = self.table.item(row, 0)
-            if trans_time_item and trans_time_item.text() == original_timestamp:
+            if self.model.text(row, 0) == original_timestamp:
                 self.set_row_highlight(row, is_playing)
     
     def clear_translation_highlight(self, original_row):
@@ -452,18 +635,7 @@ class LrcEditorDialog(QDialog):
     
     def set_row_highlight(self, row, is_playing):
         """设置行高亮样式"""
-        if is_playing:
-            bg_color = QColor("#e6f7ff")  # 淡蓝色背景
-            text_color = QColor("#1890ff")  # 深蓝色文字
-        else:
-            bg_color = QColor(Qt.GlobalColor.white)
-            text_color = QColor(Qt.GlobalColor.black)
-        
-        for col in range(self.table.columnCount()):
-            item = self.table.item(row, col)
-            if item:
-                item.setBackground(bg_color)
-                item.setForeground(text_color)
+        self.model.set_row_highlight(row, is_playing)
     
     def clear_row_highlight(self, row):
         """清除行高亮"""
@@ -471,30 +643,32 @@ class LrcEditorDialog(QDialog):
     
     def adjust_timestamp(self, delta_ms):
         """调整当前选中行的时间戳"""
-        current_rows = self.table.selectedItems()
-        if not current_rows: return
-        
-        row = current_rows[0].row()
-        time_item = self.table.item(row, 0)
-        if not time_item or not time_item.text(): return
+        row = self.table.currentIndex().row()
+        if row < 0: return
+        time_str = self.model.text(row, 0)
+        if not time_str: return
         
-        old_time_ms = parse_time_tag(time_item.text())
+        old_time_ms = parse_time_tag(time_str)
         if old_time_ms < 0: return
         
         new_time_ms = max(0, old_time_ms + delta_ms)
         new_time_str = f"[{format_ms(new_time_ms)}]"
         
-        self.table.setItem(row, 0, QTableWidgetItem(new_time_str))
+        self.model.set_text(row, 0, new_time_str)
         
         # 同时调整字级时间戳
-        lyric_item = self.table.item(row, 1)
-        if lyric_item:
-            original_text = lyric_item.text()
-            shifted_text = self.shift_timestamps_in_string(original_text, delta_ms)
-            self.table.setItem(row, 1, QTableWidgetItem(shifted_text))
+        shifted_text = self.shift_timestamps_in_string(self.model.text(row, 1), delta_ms)
+        self.model.set_text(row, 1, shifted_text)
         
         # 重新缓存
         self.cache_timestamps()
+        self.refresh_preview()
+    
+    def refresh_preview(self):
+        """按当前播放位置重绘高亮行和预览区（暂停时 positionChanged 不会触发）"""
+        pos = self.player.position()
+        self.highlight_current_line(pos)
+        self.update_line_preview(pos)
     
     def update_line_preview(self, current_pos_ms):
         """更新顶部预览区"""
@@ -528,29 +702,20 @@ class LrcEditorDialog(QDialog):
             return
         
         # 获取原文
-        text_item = self.table.item(current_row, 1)
-        if not text_item:
-            return
-        
-        line_text = text_item.text()
+        original_timestamp = self.model.text(current_row, 0)
+        line_text = self.model.text(current_row, 1)
         
         # 查找翻译行
         translations = []
-        time_item = self.table.item(current_row, 0)
-        if time_item:
-            original_timestamp = time_item.text()
-            for row in range(current_row + 1, self.table.rowCount()):
-                if row not in self.translation_rows:
-                    break
-                trans_time_item = self.table.item(row, 0)
-                trans_text_item = self.table.item(row, 1)
-                if trans_time_item and trans_text_item and trans_time_item.text() == original_timestamp:
-                    # 移除翻译标记图标
-                    trans_text = trans_text_item.text().replace("🌐 ", "")
-                    translations.append(trans_text)
+        for row in range(current_row + 1, self.model.rowCount()):
+            if row not in self.translation_rows:
+                break
+            if self.model.text(row, 0) == original_timestamp:
+                # 移除翻译标记图标
+                translations.append(self.model.text(row, 1).replace("🌐 ", ""))
         
         # 渲染预览
-        if '[' in line_text and ']' in line_text and re.search(r'\[\d{2}:\d{2}\.\d{2,3}\]', line_text):
+        if '[' in line_text and ']' in line_text and _INNER_TS_RE.search(line_text):
             # 有字级时间戳，渲染卡拉OK效果
             html = self.render_karaoke_html(line_text, current_pos_ms)
         else:
@@ -1,27 +1,153 @@
 # -*- coding: utf-8 -*-
 import os
+import importlib.util
 import sys
-import time
 from multiprocessing import Process, Queue, Event
+from multiprocessing.connection import wait as wait_connections
+from multiprocessing.shared_memory import SharedMemory
 from queue import Empty
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-                             QFileDialog, QTextEdit, QProgressBar, QMessageBox, QComboBox, 
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
+                             QFileDialog, QPlainTextEdit, QProgressBar, QMessageBox, QComboBox, 
                              QSplitter, QSpinBox, QCheckBox)
 from PyQt6.QtGui import QAction, QDragEnterEvent, QDropEvent, QSyntaxHighlighter, QTextCharFormat, QColor
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
 
-from config import TIMEOUT_CHECK_INTERVAL, PROMPT_DEFAULTS, ConfigManager, LANGUAGES
+from config import RESULT_SHM_SIZE, TIMEOUT_CHECK_INTERVAL, PROMPT_DEFAULTS, ConfigManager, LANGUAGES
 from core.lrc_parser import LrcParser
+from core.lrc_payload import pack_lrc_payload
 from core.whisper_worker import daemon_worker, WorkerArgs
-from ui.editor_dialog import LrcEditorDialog
-from ui.settings_dialog import SettingsDialog
 from ui.model_manager_dialog import ModelManagerDialog
 
+# 只检查是否安装，不在界面进程中真正导入（导入会加载 ctranslate2 等大型库）
+HAS_FASTER_WHISPER = importlib.util.find_spec("faster_whisper") is not None
+
 try:
-    import faster_whisper
-    HAS_FASTER_WHISPER = True
+    from charset_normalizer import from_bytes as detect_charset
+    HAS_CHARSET_NORMALIZER = True
 except ImportError:
-    HAS_FASTER_WHISPER = False
+    HAS_CHARSET_NORMALIZER = False
+
+def _decode_lyrics_bytes(data):
+    """解码歌词文件内容
+    
+    优先按 UTF-8（含 BOM）解码；失败时使用 charset_normalizer 检测编码，
+    不可用或检测失败时再依次尝试常见的中文编码。
+    
+    Args:
+        data: 文件的原始字节
+        
+    Returns:
+        解码后的文本
+    """
+    try:
+        return data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        pass
+    
+    if HAS_CHARSET_NORMALIZER:
+        best = detect_charset(data).best()
+        if best is not None:
+            return str(best)
+    
+    for enc in ('gbk', 'big5'):
+        try:
+            return data.decode(enc)
+        except UnicodeDecodeError:
+            continue
+    return data.decode('utf-8', errors='replace')
+
+def _scan_timestamps(text):
+    """扫描文本中所有 [mm:ss.xx] / [mm:ss.xxx] 时间戳
+    
+    按 '[' 位置逐个做固定偏移校验，不经过正则引擎，匹配结果与原先的正则一致。
+    
+    Args:
+        text: 文本块内容
+        
+    Yields:
+        (起始位置, 长度) 元组
+    """
+    i = text.find('[')
+    while i != -1:
+        if text[i + 3:i + 4] == ':' and text[i + 6:i + 7] == '.':
+            end = text.find(']', i + 9, i + 11)
+            if end != -1 and (text[i + 1:i + 3] + text[i + 4:i + 6] + text[i + 7:end]).isdecimal():
+                yield i, end + 1 - i
+                i = text.find('[', end + 1)
+                continue
+        i = text.find('[', i + 1)
+
+# str.translate 删除表：覆盖 str.split() 视为空白的全部字符（最大为 U+3000 全角空格）
+_WHITESPACE_TABLE = dict.fromkeys(c for c in range(0x3001) if chr(c).isspace())
+
+def _normalize_lyrics(text):
+    """去除所有空白字符，用于宽松比较歌词文本"""
+    return text.translate(_WHITESPACE_TABLE)
+
+# 拖拽导入时识别的文件类型
+_AUDIO_EXTS = frozenset(('.mp3', '.wav', '.flac', '.m4a', '.ogg'))
+_LYRIC_EXTS = frozenset(('.lrc', '.txt', '.srt'))
+
+# 应用级样式表
+_APP_QSS = """
+    QMainWindow { background-color: #f5f7fa; }
+    QLabel { font-family: 'Microsoft YaHei'; color: #333; font-size: 13px; }
+    QPlainTextEdit { background: white; border: 1px solid #dcdfe6; border-radius: 6px; padding: 10px; font-family: Consolas; font-size: 14px; }
+    QLineEdit { background: white; border: 1px solid #dcdfe6; border-radius: 4px; padding: 5px; }
+    QPushButton { background-color: #409eff; color: white; border-radius: 6px; padding: 8px 15px; font-weight: bold; }
+    QPushButton:hover { background-color: #66b1ff; }
+    QPushButton:disabled { background-color: #c0c4cc; color: #909399; }
+    QComboBox, QSpinBox { padding: 5px; border: 1px solid #dcdfe6; background: white; border-radius: 4px; }
+    QProgressBar { border: 1px solid #dcdfe6; border-radius: 4px; text-align: center; }
+    QProgressBar::chunk { background-color: #409eff; width: 20px; }
+"""
+
+class QueueReader(QObject):
+    """在后台线程中阻塞读取进度/结果队列，通过信号把消息交给界面线程
+    
+    每次唤醒时取空进度队列，整批通过 progress 信号发出；结果消息逐条通过 result 信号发出。
+    向进度队列放入 None 或调用 stop() 即可让读取循环退出；等待带超时，stop() 最迟一个检查间隔后生效。
+    """
+    progress = pyqtSignal(list)
+    result = pyqtSignal(object)
+
+    def __init__(self, progress_queue, result_queue):
+        super().__init__()
+        self.progress_queue = progress_queue
+        self.result_queue = result_queue
+        self._stopped = False
+
+    def stop(self):
+        self._stopped = True
+
+    def run(self):
+        progress_reader = self.progress_queue._reader
+        result_reader = self.result_queue._reader
+        readers = [progress_reader, result_reader]
+        # 循环内用到的方法提前绑定为局部变量
+        get_progress = self.progress_queue.get_nowait
+        get_result = self.result_queue.get_nowait
+        emit_progress = self.progress.emit
+        emit_result = self.result.emit
+        while not self._stopped:
+            ready = wait_connections(readers, TIMEOUT_CHECK_INTERVAL)
+            if progress_reader in ready:
+                messages = []
+                append = messages.append
+                while True:
+                    try:
+                        msg = get_progress()
+                    except Empty: break
+                    if msg is None:
+                        return
+                    append(msg)
+                if messages:
+                    emit_progress(messages)
+            if result_reader in ready:
+                while True:
+                    try:
+                        emit_result(get_result())
+                    except Empty: break
 
 class LrcHighlighter(QSyntaxHighlighter):
     def __init__(self, document):
@@ -31,10 +157,11 @@ class LrcHighlighter(QSyntaxHighlighter):
         self.format.setFontWeight(700) # Bold
 
     def highlightBlock(self, text):
-        import re
         # Highlight [mm:ss.xx]
-        for match in re.finditer(r'\[\d{2}:\d{2}\.\d{2,3}\]', text):
-            self.setFormat(match.start(), match.end() - match.start(), self.format)
+        set_format = self.setFormat
+        fmt = self.format
+        for start, length in _scan_timestamps(text):
+            set_format(start, length, fmt)
 
 class LyricsGenApp(QMainWindow):
     def __init__(self):
@@ -55,14 +182,29 @@ class LyricsGenApp(QMainWindow):
         self.result_queue = Queue()
         self.progress_queue = Queue()
         self.stop_event = Event()
+        self.exit_event = Event() # 置位后常驻进程退出
         
-        self.check_timer = None
+        # 生成结果通过共享内存回传，结果队列只传递长度，避免大段歌词的 pickle 开销
+        try:
+            self.result_shm = SharedMemory(create=True, size=RESULT_SHM_SIZE)
+        except OSError as e:
+            print(f"Shared memory unavailable, results will be sent through the queue: {e}")
+            self.result_shm = None
+        # 当前任务的解析数据共享内存，任务结束后释放
+        self.task_shm = None
+        
+        self.queue_reader = None
+        self.queue_reader_thread = None
         self.raw_lrc_content = None 
+        # 原始 LRC 的解析结果缓存: (原始内容, 纯文本, 规范化纯文本, 时间戳, 头部, 歌词行, 翻译)
+        self._raw_parse_cache = None
         
         self.chk_force_cali = None
         self.chk_avg_dist = None
         
         self.is_running_task = False # Track actual task status
+        self._task_id = 0 # 当前任务编号，用于丢弃旧任务残留的消息
+        self._last_pbar_val = None
         
         self.setup_menu()
         self.setup_ui()
@@ -72,11 +214,23 @@ class LyricsGenApp(QMainWindow):
         """Start the persistent worker process"""
         if self.worker_process is None or not self.worker_process.is_alive():
             # 将结果队列、进度队列和停止事件直接传递给子进程
+            shm_name = self.result_shm.name if self.result_shm else None
             self.worker_process = Process(target=daemon_worker, 
-                                          args=(self.task_queue, self.result_queue, self.progress_queue, self.stop_event))
+                                          args=(self.task_queue, self.result_queue, self.progress_queue, self.stop_event,
+                                                self.exit_event, shm_name))
             self.worker_process.daemon = True
             self.worker_process.start()
             print(f"Daemon worker started with PID: {self.worker_process.pid}")
+        
+        if self.queue_reader_thread is None:
+            # 队列读取放在独立线程，界面线程不再轮询
+            self.queue_reader = QueueReader(self.progress_queue, self.result_queue)
+            self.queue_reader_thread = QThread(self)
+            self.queue_reader.moveToThread(self.queue_reader_thread)
+            self.queue_reader_thread.started.connect(self.queue_reader.run)
+            self.queue_reader.progress.connect(self.on_progress_messages)
+            self.queue_reader.result.connect(self.on_result_message)
+            self.queue_reader_thread.start()
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
@@ -88,34 +242,51 @@ class LyricsGenApp(QMainWindow):
         files = [u.toLocalFile() for u in event.mimeData().urls()]
         for f in files:
             ext = os.path.splitext(f)[1].lower()
-            if ext in ['.mp3', '.wav', '.flac', '.m4a', '.ogg']:
-                self.audio_path = f
-                self.path_lbl.setText(f"🎵 {os.path.basename(f)}")
-                self.status.setText("音频已加载 (通过拖拽)")
-                if self.out_txt.toPlainText().strip(): self.btn_cali.setEnabled(True)
-            elif ext in ['.lrc', '.txt', '.srt']:
-                self.import_lrc_file(f)
-
-    def import_lrc_file(self, f):
+            if ext in _AUDIO_EXTS:
+                self.set_audio_path(f, "音频已加载 (通过拖拽)")
+            elif ext in _LYRIC_EXTS:
+                self.import_lrc_file(f, ext)
+
+    def set_audio_path(self, f, status_text):
+        self.audio_path = f
+        self.path_lbl.setText(f"🎵 {os.path.basename(f)}")
+        self.status.setText(status_text)
+        if self.out_txt.toPlainText().strip(): self.btn_cali.setEnabled(True)
+
+    def import_lrc_file(self, f, ext=None):
         """Helper for import logic"""
         try:
-            raw = ""
-            for enc in ['utf-8', 'gbk', 'utf-8-sig', 'big5']:
-                try:
-                    with open(f, 'r', encoding=enc) as file:
-                        raw = file.read()
-                        break
-                except (UnicodeDecodeError, IOError):
-                    continue
+            # 只读取一次文件，再在内存中判断编码
+            with open(f, 'rb') as file:
+                raw = _decode_lyrics_bytes(file.read())
             
             self.raw_lrc_content = raw 
-            ext = os.path.splitext(f)[1].lower()
+            if ext is None:
+                ext = os.path.splitext(f)[1].lower()
             clean_text = self.lrc_parser.parse(raw, ext)
-            self.input_txt.setText(clean_text)
+            self._cache_raw_parse(raw, clean_text, self.lrc_parser)
+            self._bulk_set_text(self.input_txt, clean_text)
             self.status.setText(f"导入成功: {os.path.basename(f)}")
         except Exception as e:
             QMessageBox.warning(self, "导入错误", str(e))
     
+    def _bulk_set_text(self, widget, text):
+        """整体替换输入框文本
+        
+        替换期间先把高亮器从文档上摘下，避免逐块触发 highlightBlock，重新挂上后统一高亮一次。
+        """
+        self.highlighter.setDocument(None)
+        widget.setPlainText(text)
+        self.highlighter.setDocument(widget.document())
+
+    def _cache_raw_parse(self, raw, clean_text, parser):
+        """缓存原始 LRC 的解析结果，开始生成时无需重复解析"""
+        self._raw_parse_cache = (
+            raw, clean_text, _normalize_lyrics(clean_text), list(parser.lines_timestamps),
+            list(parser.headers), list(parser.lines_text),
+            {k: list(v) for k, v in parser.translations.items()}
+        )
+
     def setup_menu(self):
         menu_bar = self.menuBar()
         
@@ -152,18 +323,10 @@ class LyricsGenApp(QMainWindow):
         settings_menu.addAction(model_mgr)
 
     def setup_ui(self):
-        self.setStyleSheet("""
-            QMainWindow { background-color: #f5f7fa; }
-            QLabel { font-family: 'Microsoft YaHei'; color: #333; font-size: 13px; }
-            QTextEdit { background: white; border: 1px solid #dcdfe6; border-radius: 6px; padding: 10px; font-family: Consolas; font-size: 14px; }
-            QLineEdit { background: white; border: 1px solid #dcdfe6; border-radius: 4px; padding: 5px; }
-            QPushButton { background-color: #409eff; color: white; border-radius: 6px; padding: 8px 15px; font-weight: bold; }
-            QPushButton:hover { background-color: #66b1ff; }
-            QPushButton:disabled { background-color: #c0c4cc; color: #909399; }
-            QComboBox, QSpinBox { padding: 5px; border: 1px solid #dcdfe6; background: white; border-radius: 4px; }
-            QProgressBar { border: 1px solid #dcdfe6; border-radius: 4px; text-align: center; }
-            QProgressBar::chunk { background-color: #409eff; width: 20px; }
-        """)
+        # 样式表设置在应用级别，只解析一次，所有窗口和对话框共享
+        app = QApplication.instance()
+        if app is not None and not app.styleSheet():
+            app.setStyleSheet(_APP_QSS)
         
         central = QWidget()
         self.setCentralWidget(central)
@@ -201,7 +364,7 @@ class LyricsGenApp(QMainWindow):
         h_lay.addWidget(btn_clr)
         h_lay.addStretch()
         l_lay.addLayout(h_lay)
-        self.input_txt = QTextEdit()
+        self.input_txt = QPlainTextEdit()
         self.input_txt.setPlaceholderText("在此粘贴包含时间戳的LRC...\n第一行为原文，后续相同时间戳的行为翻译。")
         self.highlighter = LrcHighlighter(self.input_txt.document())
         l_lay.addWidget(self.input_txt)
@@ -219,9 +382,10 @@ class LyricsGenApp(QMainWindow):
         r_head_lay.addStretch()
         r_head_lay.addWidget(self.btn_cali)
         r_lay.addLayout(r_head_lay)
-        self.out_txt = QTextEdit()
+        self.out_txt = QPlainTextEdit()
         self.out_txt.setStyleSheet("background:#f0f9eb; color: #333;")
         self.out_txt.setReadOnly(True)
+        self.out_txt.setUndoRedoEnabled(False) # 只读输出，不需要撤销栈
         r_lay.addWidget(self.out_txt)
         splitter.addWidget(right)
         layout.addWidget(splitter, 1)
@@ -275,6 +439,8 @@ class LyricsGenApp(QMainWindow):
         layout.addLayout(stat)
 
     def open_settings_dialog(self):
+        # 对话框模块在首次打开时才导入，缩短启动时间
+        from ui.settings_dialog import SettingsDialog
         dialog = SettingsDialog(self.config_manager, self)
         dialog.exec()
 
@@ -282,40 +448,40 @@ class LyricsGenApp(QMainWindow):
         dialog = ModelManagerDialog(self)
         dialog.exec()
 
-    def check_queue(self):
-        # 移除进程存活检查，因为是常驻进程
-        # if self.worker_process and not self.worker_process.is_alive(): ... 
-        
-        while True:
-            try:
-                msg = self.progress_queue.get_nowait()
-                if isinstance(msg, str):
-                    if msg.startswith("PROGRESS:"):
-                        try:
-                            val = int(msg.split(":")[1])
-                            self.pbar.setRange(0, 100)
-                            self.pbar.setValue(val)
-                        except (ValueError, IndexError) as e:
-                            # Malformed progress message, ignore
-                            pass
-                    else:
-                        self.status.setText(msg)
-            except Empty: break
-        try:
-            result_type, result_data = self.result_queue.get_nowait()
-            if result_type == "success": self.on_done(result_data)
-            elif result_type == "error": self.on_error(result_data)
-            elif result_type == "aborted": self.on_aborted()
-            self.cleanup_worker()
-        except Empty: pass
+    def on_progress_messages(self, messages):
+        # 一批消息只把最后的进度值和状态文本应用到界面，避免多次重绘
+        last_progress = None
+        last_status = None
+        current_task_id = self._task_id
+        for task_id, tag, payload in messages:
+            if task_id != current_task_id:
+                continue
+            # "P": 进度值, "S": 状态文本
+            if tag == "P":
+                last_progress = payload
+            else:
+                last_status = payload
+        if last_progress is not None and last_progress != self._last_pbar_val:
+            self._last_pbar_val = last_progress
+            self.pbar.setRange(0, 100)
+            self.pbar.setValue(last_progress)
+        if last_status is not None:
+            self.status.setText(last_status)
+
+    def on_result_message(self, msg):
+        task_id, result_type, result_data = msg
+        if task_id != self._task_id:
+            return
+        if result_type == "success": self.on_done(result_data)
+        elif result_type == "success_shm": self.on_done(bytes(self.result_shm.buf[:result_data]).decode('utf-8'))
+        elif result_type == "error": self.on_error(result_data)
+        elif result_type == "aborted": self.on_aborted()
+        self.cleanup_worker()
 
     def select_audio(self):
         f, _ = QFileDialog.getOpenFileName(self, "选择音频", "", "Audio Files (*.mp3 *.wav *.flac *.m4a *.ogg)")
         if f:
-            self.audio_path = f
-            self.path_lbl.setText(f"🎵 {os.path.basename(f)}")
-            self.status.setText("音频已加载")
-            if self.out_txt.toPlainText().strip(): self.btn_cali.setEnabled(True)
+            self.set_audio_path(f, "音频已加载")
 
     def clear_input(self):
         self.input_txt.clear()
@@ -346,6 +512,7 @@ class LyricsGenApp(QMainWindow):
         self.btn_cali.setEnabled(False)
         self.pbar.show()
         self.pbar.setRange(0, 0)
+        self._last_pbar_val = None
         
         txt = self.input_txt.toPlainText()
         
@@ -355,25 +522,29 @@ class LyricsGenApp(QMainWindow):
         used_raw_content = False
         
         if self.raw_lrc_content:
-            # 临时解析一下raw内容，看看纯文本是否匹配
-            temp_parser = LrcParser()
-            temp_clean = temp_parser.parse(self.raw_lrc_content, ".lrc")
+            # 原始内容的解析结果在导入时已缓存，只有缓存失效时才重新解析
+            cache = self._raw_parse_cache
+            if cache is None or cache[0] is not self.raw_lrc_content:
+                temp_parser = LrcParser()
+                temp_clean = temp_parser.parse(self.raw_lrc_content, ".lrc")
+                self._cache_raw_parse(self.raw_lrc_content, temp_clean, temp_parser)
+                cache = self._raw_parse_cache
             
-            # 宽松比较：去除所有空白字符
-            def normalize(s): return "".join(s.split())
+            _, cached_clean, cached_normalized, cached_timestamps, cached_headers, cached_lines, cached_translations = cache
             
-            if normalize(temp_clean) == normalize(txt):
+            # 输入框内容与导入时完全相同时直接命中；否则宽松比较：去除所有空白字符
+            if txt == cached_clean or cached_normalized == _normalize_lyrics(txt):
                 # 内容匹配，说明用户没有修改歌词文本，可以使用原始时间戳
-                current_timestamps = temp_parser.lines_timestamps
+                self.lrc_parser = LrcParser()
+                self.lrc_parser.headers = list(cached_headers)
+                self.lrc_parser.lines_text = list(cached_lines)
+                self.lrc_parser.translations = {k: list(v) for k, v in cached_translations.items()}
+                self.lrc_parser.lines_timestamps = list(cached_timestamps)
+                current_timestamps = self.lrc_parser.lines_timestamps
                 used_raw_content = True
                 print("Using cached raw LRC content for timestamps.")
             else:
                 print("Cached content mismatch. Fallback to input text.")
-                # Debug info
-                # print(f"Cached len: {len(normalize(temp_clean))}, Input len: {len(normalize(txt))}")
-                
-                # 更新主 parser 的状态
-                self.lrc_parser = temp_parser
         
         if not used_raw_content:
             # 如果不能使用缓存（内容已修改或无缓存），则解析输入框内容
@@ -403,17 +574,8 @@ class LyricsGenApp(QMainWindow):
         # 重置 stop_event
         self.stop_event.clear()
         
-        # 清空队列中可能残留的旧消息
-        while not self.result_queue.empty():
-            try:
-                self.result_queue.get_nowait()
-            except Empty:
-                pass
-        while not self.progress_queue.empty():
-            try:
-                self.progress_queue.get_nowait()
-            except Empty:
-                pass
+        # 新任务编号：队列中残留的旧任务消息会在消息处理时被忽略，无需清空队列
+        self._task_id += 1
         
         args = WorkerArgs(
             audio_path=self.audio_path,
@@ -428,17 +590,28 @@ class LyricsGenApp(QMainWindow):
             release_vram=release_vram,
             lrc_timestamps=current_timestamps, # 传递时间戳
             enable_force_calibration=self.chk_force_cali.isChecked(),
-            enable_avg_distribution=self.chk_avg_dist.isChecked()
+            enable_avg_distribution=self.chk_avg_dist.isChecked(),
+            task_id=self._task_id
         )
+        
+        # 解析数据写入共享内存，任务队列只传递名称和长度，避免对大列表进行 pickle
+        self.release_task_shm()
+        payload = pack_lrc_payload(lrc_parser_data, current_timestamps)
+        try:
+            self.task_shm = SharedMemory(create=True, size=max(1, len(payload)))
+            self.task_shm.buf[:len(payload)] = payload
+            args.lrc_shm_name = self.task_shm.name
+            args.lrc_shm_size = len(payload)
+            args.lrc_parser_data = {}
+            args.lrc_timestamps = []
+        except OSError as e:
+            print(f"Shared memory unavailable, sending lyrics data through the queue: {e}")
+            self.task_shm = None
 
         # 确保后台进程已启动
         self.init_worker()
         # 发送任务
         self.task_queue.put(args)
-        
-        self.check_timer = QTimer()
-        self.check_timer.timeout.connect(self.check_queue)
-        self.check_timer.start(int(TIMEOUT_CHECK_INTERVAL * 1000))
 
     def stop(self):
         if self.stop_event:
@@ -446,8 +619,15 @@ class LyricsGenApp(QMainWindow):
             self.stop_event.set()
             # 此时不需要 terminate 进程，daemon 会检测 stop_event 并优雅退出当前任务
 
+    def release_task_shm(self):
+        """释放当前任务的解析数据共享内存"""
+        if self.task_shm:
+            self.task_shm.close()
+            self.task_shm.unlink()
+            self.task_shm = None
+
     def cleanup_worker(self):
-        if self.check_timer: self.check_timer.stop(); self.check_timer = None
+        self.release_task_shm()
         # 不再销毁 worker_process，保持后台常驻
         # 也不要重置队列，因为它们是复用的
         pass
@@ -458,7 +638,7 @@ class LyricsGenApp(QMainWindow):
         self.btn_stop.setEnabled(False)
         self.btn_cali.setEnabled(True)
         self.pbar.hide()
-        self.out_txt.setText(lrc)
+        self.out_txt.setPlainText(lrc)
         self.status.setText("✅ 任务完成")
 
     def on_aborted(self):
@@ -479,10 +659,11 @@ class LyricsGenApp(QMainWindow):
         content = self.out_txt.toPlainText()
         if not content: return QMessageBox.warning(self, "提示", "没有歌词内容")
         
+        from ui.editor_dialog import LrcEditorDialog
         dialog = LrcEditorDialog(self.audio_path, content, self)
         if dialog.exec():
             if dialog.result_lrc:
-                self.out_txt.setText(dialog.result_lrc)
+                self.out_txt.setPlainText(dialog.result_lrc)
                 self.status.setText("✅ 校准已应用")
 
     def save(self):
@@ -490,7 +671,10 @@ class LyricsGenApp(QMainWindow):
         if not txt: return
         
         default_dir = self.config_manager.get("OUTPUT_DIR")
-        default_filename = os.path.splitext(os.path.basename(self.audio_path))[0] + ".lrc" if self.audio_path else "out.lrc"
+        if self.audio_path:
+            default_filename = os.path.splitext(os.path.basename(self.audio_path))[0] + ".lrc"
+        else:
+            default_filename = "out.lrc"
         
         if default_dir and os.path.exists(default_dir):
             default_path = os.path.join(default_dir, default_filename)
@@ -518,8 +702,32 @@ class LyricsGenApp(QMainWindow):
 
         # 关闭常驻进程
         if self.worker_process and self.worker_process.is_alive():
-            self.task_queue.put("EXIT")
-            # 给他一点时间退出
-            time.sleep(0.1)
+            self.exit_event.set()
+            # 放入唤醒项，常驻进程不必等到任务队列超时即可检查退出事件并释放资源
+            self.task_queue.put(None)
+            self.worker_process.join(timeout=1.0)
+        
+        # 结束队列读取线程，必须在强制终止常驻进程之前：
+        # 进程写到一半被终止时，读取线程可能卡在不完整的消息上
+        if self.queue_reader_thread is not None:
+            self.queue_reader.stop()
+            self.progress_queue.put(None)
+            if self.queue_reader_thread.wait(int(TIMEOUT_CHECK_INTERVAL * 2000)):
+                self.queue_reader_thread = None
+                self.queue_reader = None
+            else:
+                # 保留引用，避免销毁仍在运行的 QThread 导致进程崩溃
+                print("Queue reader thread did not stop in time.")
+        
+        # 仍未退出（例如推理无法及时中断）时才强制终止
+        if self.worker_process and self.worker_process.is_alive():
+            self.worker_process.terminate()
+            self.worker_process.join()
+        
+        if self.result_shm:
+            self.result_shm.close()
+            self.result_shm.unlink()
+            self.result_shm = None
+        self.release_task_shm()
             
         event.accept()
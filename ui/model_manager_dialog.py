@@ -1,39 +1,203 @@
 # -*- coding: utf-8 -*-
 import os
+import time
 
-from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTableWidget,
-                             QTableWidgetItem, QPushButton, QProgressBar, QLabel,
-                             QHeaderView, QMessageBox, QWidget, QLineEdit, QFormLayout)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QObject
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTableView, QPushButton, QLabel,
+                             QHeaderView, QMessageBox, QLineEdit, QApplication, QStyle,
+                             QStyledItemDelegate, QStyleOptionProgressBar)
+from PyQt6.QtCore import (Qt, pyqtSignal, pyqtSlot, QObject, QAbstractTableModel, QModelIndex, QRect,
+                          QRunnable, QThreadPool, QDeadlineTimer, QEventLoop)
+from PyQt6.QtGui import QColor, QPainter, QPixmap, QPixmapCache
 
 from core.model_manager import ModelManager, ModelInfo, ModelDownloader, ModelType
 from config import ConfigManager
 
-class DownloadWorker(QObject):
-    progress = pyqtSignal(int, str)
-    finished = pyqtSignal(bool, str) # success, msg
+class DownloadSignals(QObject):
+    """所有下载任务共享的信号中心
 
-    def __init__(self, model_info: ModelInfo, mirror_url: str = None):
+    QRunnable 本身不能发射信号，任务在线程池中通过本对象发射，信号带上模型标识，
+    由对话框中的同一个槽函数根据标识找到对应行，跨线程时自动以排队方式投递。
+    """
+    progress = pyqtSignal(str, int, str) # model_id, percent, msg
+    finished = pyqtSignal(str, bool, str) # model_id, success, msg
+
+
+class DownloadTask(QRunnable):
+    def __init__(self, model_id: str, model_info: ModelInfo, signals: DownloadSignals, mirror_url: str = None):
         super().__init__()
+        # 由对话框持有引用，任务结束后再释放，避免线程池删除后 Python 端仍访问
+        self.setAutoDelete(False)
+        self.model_id = model_id
         self.model_info = model_info
         self.mirror_url = mirror_url
-        self.downloader = None
+        self.signals = signals
+        self.downloader = ModelDownloader(self.model_info, self._callback)
+        self.downloader.set_mirror(self.mirror_url)
+        # 进度信号节流：最多约 30 次/秒，相同内容不重复发送
+        self._last_emit_ts = 0.0
+        self._last_pct = -1
+        self._last_msg = None
 
     def run(self):
         try:
-            self.downloader = ModelDownloader(self.model_info, self._callback)
-            self.downloader.set_mirror(self.mirror_url)
             self.downloader.start()
-            self.finished.emit(True, "Success")
+            if self.downloader.stop_flag:
+                self.signals.finished.emit(self.model_id, False, "下载已停止")
+            else:
+                self.signals.finished.emit(self.model_id, True, "Success")
         except Exception as e:
-            self.finished.emit(False, str(e))
+            self.signals.finished.emit(self.model_id, False, str(e))
 
     def _callback(self, percent, msg):
-        self.progress.emit(percent, msg)
+        now = time.monotonic()
+        # 出错 (-1)、完成 (100) 和消息文本变化总是立即发送，只节流同一消息下的百分比刷新
+        if 0 <= percent < 100 and msg == self._last_msg:
+            if percent == self._last_pct:
+                return
+            if now - self._last_emit_ts < 0.033:
+                return
+        self._last_emit_ts = now
+        self._last_pct = percent
+        self._last_msg = msg
+        self.signals.progress.emit(self.model_id, percent, msg)
 
     def stop(self):
-        if self.downloader:
-            self.downloader.stop()
+        self.downloader.stop()
+
+# 关闭窗口时保持界面响应、等待下载任务停止的最长时间 (ms)
+CLOSE_WAIT_MS = 3000
+
+# 操作按钮样式，按钮创建时只需设置 role 属性
+_ACTION_BUTTON_QSS = (
+    "QPushButton[role='delete'] { background-color: #f56c6c; color: white; }"
+    "QPushButton[role='pause'] { background-color: #e6a23c; color: white; }"
+    "QPushButton[role='download'] { background-color: #409eff; color: white; }"
+)
+
+# 进度列的自定义数据角色：返回 0-100 的进度值，-1 表示不显示进度条
+PROGRESS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+class ModelTableModel(QAbstractTableModel):
+    """模型列表数据模型
+    
+    直接读取 ModelInfo 列表，下载进度、提示文本和临时状态文本按行保存在并行列表中，
+    单行变化时只发出对应单元格的 dataChanged。
+    """
+    HEADERS = ["模型名称", "类型", "状态", "进度", "操作"]
+    # 类型列前景色，预先构造，避免每次 data() 调用都新建 QColor
+    _FASTER_WHISPER_FG = QColor(Qt.GlobalColor.darkGreen)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._models = []
+        self._progress = []
+        self._tooltips = []
+        self._status = []  # 覆盖默认状态文本（如“下载中...”），None 表示按是否已下载显示
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._models)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        model = self._models[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return model.name
+            if col == 1:
+                return model.type
+            if col == 2:
+                status = self._status[row]
+                if status is not None:
+                    return status
+                return "已下载" if model.is_downloaded else "未下载"
+            return None
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if col == 1 and model.type == ModelType.FASTER_WHISPER:
+                return self._FASTER_WHISPER_FG
+            return None
+        if col == 3:
+            if role == PROGRESS_ROLE:
+                return self._progress[row]
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return self._tooltips[row] or None
+        return None
+
+    def set_models(self, models):
+        """整体替换模型列表"""
+        self.beginResetModel()
+        self._models = models
+        self._progress = [-1] * len(models)
+        self._tooltips = [""] * len(models)
+        self._status = [None] * len(models)
+        self.endResetModel()
+
+    def set_status(self, row, text):
+        """设置状态列文本，None 表示恢复为按是否已下载显示"""
+        self._status[row] = text
+        index = self.index(row, 2)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+
+    def set_progress(self, row, percent, tooltip=None):
+        """更新进度值（-1 隐藏进度条）和提示文本，只刷新进度单元格"""
+        self._progress[row] = percent
+        if tooltip is not None:
+            self._tooltips[row] = tooltip
+        index = self.index(row, 3)
+        self.dataChanged.emit(index, index, [PROGRESS_ROLE, Qt.ItemDataRole.ToolTipRole])
+
+    def set_tooltip(self, row, tooltip):
+        self._tooltips[row] = tooltip
+        index = self.index(row, 3)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.ToolTipRole])
+
+class ProgressDelegate(QStyledItemDelegate):
+    """在单元格内直接绘制进度条，不为每行创建 QProgressBar 控件
+    
+    绘制结果按 (尺寸, 缩放比, 进度, 是否可用) 缓存到 QPixmapCache，重绘时直接贴图。
+    """
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        value = index.data(PROGRESS_ROLE)
+        if value is None or value < 0:
+            return
+        rect = option.rect.adjusted(2, 2, -2, -2)
+        if rect.width() <= 0 or rect.height() <= 0:
+            return
+        
+        enabled = bool(option.state & QStyle.StateFlag.State_Enabled)
+        dpr = painter.device().devicePixelRatioF()
+        key = f"model_pb_{rect.width()}x{rect.height()}@{dpr}_{value}_{int(enabled)}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(rect.width() * dpr), round(rect.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            bar = QStyleOptionProgressBar()
+            bar.rect = QRect(0, 0, rect.width(), rect.height())
+            bar.state = option.state & QStyle.StateFlag.State_Enabled
+            bar.minimum = 0
+            bar.maximum = 100
+            bar.progress = value
+            bar.textVisible = False
+            style = option.widget.style() if option.widget else QApplication.style()
+            
+            pm_painter = QPainter(pixmap)
+            style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, pm_painter, option.widget)
+            pm_painter.end()
+            QPixmapCache.insert(key, pixmap)
+        painter.drawPixmap(rect.topLeft(), pixmap)
 
 class ModelManagerDialog(QDialog):
     def __init__(self, parent=None):
@@ -52,14 +216,29 @@ class ModelManagerDialog(QDialog):
             model_dir = os.path.abspath(model_dir)
             
         self.manager = ModelManager(model_dir)
+        # 镜像地址只在保存设置时变化，缓存下来供每次开始下载时使用
+        self._mirror_url = self.config.get("HF_MIRROR", "https://hf-mirror.com")
         self.model_list = []
-        self.download_threads = {} # row -> (thread, worker)
+        self.downloads = {} # model_id -> DownloadTask
+        self._row_by_id = {} # model_id -> row
+        self._last_progress = {} # model_id -> (percent, msg)，用于跳过重复的进度更新
+
+        # 下载任务在线程池中执行，最多同时下载两个模型
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self.download_signals = DownloadSignals(self)
+        self.download_signals.progress.connect(self.update_progress)
+        self.download_signals.finished.connect(self.on_download_finished)
+        self._row_buttons = {} # row -> 操作按钮，只包含已创建按钮的行
+        self._closing = False
 
         self.setup_ui()
         self.refresh_list()
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
+        # 操作按钮按 role 属性着色，样式表只在对话框上解析一次
+        self.setStyleSheet(_ACTION_BUTTON_QSS)
         
         info_lbl = QLabel("提示: Faster-Whisper 模型通常比标准模型更快且精度接近。\n如果网速较慢，请优先下载 Small 或 Medium 模型。")
         info_lbl.setStyleSheet("color: #666; margin-bottom: 10px;")
@@ -69,7 +248,7 @@ class ModelManagerDialog(QDialog):
         mirror_layout = QHBoxLayout()
         mirror_layout.addWidget(QLabel("下载镜像源 (Faster-Whisper):"))
         self.mirror_edit = QLineEdit()
-        self.mirror_edit.setText(self.config.get("HF_MIRROR", "https://hf-mirror.com"))
+        self.mirror_edit.setText(self._mirror_url)
         self.mirror_edit.setPlaceholderText("https://hf-mirror.com")
         self.mirror_edit.setToolTip("设置 HuggingFace 镜像源以加速国内下载")
         save_mirror_btn = QPushButton("保存镜像设置")
@@ -78,12 +257,14 @@ class ModelManagerDialog(QDialog):
         mirror_layout.addWidget(save_mirror_btn)
         layout.addLayout(mirror_layout)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["模型名称", "类型", "状态", "进度", "操作"])
+        self.table_model = ModelTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        self.table.setItemDelegateForColumn(3, ProgressDelegate(self.table))
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        self.table.verticalScrollBar().valueChanged.connect(self._ensure_buttons_visible)
         layout.addWidget(self.table)
 
         btn_box = QHBoxLayout()
@@ -101,133 +282,151 @@ class ModelManagerDialog(QDialog):
         if not url: return
         self.config.set("HF_MIRROR", url)
         self.config.save()
+        self._mirror_url = url
         QMessageBox.information(self, "成功", "镜像源设置已保存。")
 
     def refresh_list(self):
-        # Keep existing rows if possible to avoid flicker, but full refresh is safer for logic
-        self.table.setRowCount(0)
+        # 名称、类型、状态、进度由数据模型提供，只有操作列需要真实按钮
         self.model_list = self.manager.get_model_list()
-        
-        for i, model in enumerate(self.model_list):
-            self.table.insertRow(i)
-            
-            # Name
-            self.table.setItem(i, 0, QTableWidgetItem(model.name))
-            
-            # Type
-            type_item = QTableWidgetItem(model.type)
-            if model.type == ModelType.FASTER_WHISPER:
-                type_item.setForeground(Qt.GlobalColor.darkGreen)
-            self.table.setItem(i, 1, type_item)
-            
-            # Status
-            status_str = "已下载" if model.is_downloaded else "未下载"
-            self.table.setItem(i, 2, QTableWidgetItem(status_str))
-            
-            # Progress Bar Container
-            pbar_widget = QWidget()
-            pbar_layout = QVBoxLayout(pbar_widget)
-            pbar_layout.setContentsMargins(2, 2, 2, 2)
-            pbar = QProgressBar()
-            pbar.setRange(0, 100)
-            pbar.setValue(0)
-            pbar.setTextVisible(False) # We will use label for text if needed, or tooltip
-            pbar.hide()
-            pbar_layout.addWidget(pbar)
-            self.table.setCellWidget(i, 3, pbar_widget)
-            
-            # Action Button
-            self.update_action_button(i, model)
+        self._row_buttons.clear()
+        self._row_by_id = {self.model_id(m): i for i, m in enumerate(self.model_list)}
+
+        # 填充期间暂停重绘和按内容自适应列宽，结束后只计算一次列宽
+        header = self.table.horizontalHeader()
+        self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
+        try:
+            self.table_model.set_models(self.model_list)
+            self._ensure_buttons_visible()
+        finally:
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+            header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+            self.table.resizeColumnToContents(0)
+            self.table.resizeColumnToContents(1)
+            self.table.setUpdatesEnabled(True)
+
+    def _ensure_buttons_visible(self, *args):
+        """只为可见行（上下各多两行）创建操作按钮，滚动或缩放窗口时再补齐"""
+        count = len(self.model_list)
+        if not count:
+            return
+        first = self.table.rowAt(0)
+        last = self.table.rowAt(self.table.viewport().height() - 1)
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = count - 1
+        for row in range(max(0, first - 2), min(count, last + 3)):
+            if row not in self._row_buttons:
+                self.update_action_button(row, self.model_list[row])
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._ensure_buttons_visible()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._ensure_buttons_visible()
+
+    @staticmethod
+    def model_id(model):
+        # 不同类型下存在同名模型，标识需同时包含类型
+        return f"{model.type}:{model.name}"
 
     def update_action_button(self, row, model):
         # Helper to create/update the action button
         btn = QPushButton()
         if model.is_downloaded:
             btn.setText("删除")
-            btn.setStyleSheet("background-color: #f56c6c; color: white;")
-            btn.clicked.connect(lambda checked, r=row: self.delete_model(r))
+            btn.setProperty("role", "delete")
         else:
-            if row in self.download_threads:
+            if self.model_id(model) in self.downloads:
                 # Active download
                 btn.setText("暂停") # Actually stop
-                btn.setStyleSheet("background-color: #e6a23c; color: white;")
-                btn.clicked.connect(lambda checked, r=row: self.stop_download(r))
+                btn.setProperty("role", "pause")
             else:
                 btn.setText("下载")
-                btn.setStyleSheet("background-color: #409eff; color: white;")
-                btn.clicked.connect(lambda checked, r=row: self.start_download(r))
+                btn.setProperty("role", "download")
+        # 所有按钮共用同一个槽，行号记录在按钮属性中
+        btn.setProperty("row", row)
+        btn.clicked.connect(self.on_action_clicked)
         
-        self.table.setCellWidget(row, 4, btn)
+        self.table.setIndexWidget(self.table_model.index(row, 4), btn)
+        self._row_buttons[row] = btn
+
+    @pyqtSlot()
+    def on_action_clicked(self):
+        row = self.sender().property("row")
+        model = self.model_list[row]
+        if model.is_downloaded:
+            self.delete_model(row)
+        elif self.model_id(model) in self.downloads:
+            self.stop_download(row)
+        else:
+            self.start_download(row)
 
     def start_download(self, row):
         model = self.model_list[row]
+        model_id = self.model_id(model)
+        if model_id in self.downloads:
+            return
         
         # Update UI
-        self.table.item(row, 2).setText("下载中...")
-        
-        pbar_widget = self.table.cellWidget(row, 3)
-        pbar = pbar_widget.findChild(QProgressBar)
-        pbar.show()
-        pbar.setValue(0)
-
-        # Create Thread
-        thread = QThread()
-        mirror = self.config.get("HF_MIRROR", "https://hf-mirror.com")
-        worker = DownloadWorker(model, mirror)
-        worker.moveToThread(thread)
-        
-        thread.started.connect(worker.run)
-        worker.progress.connect(lambda p, msg: self.update_progress(row, p, msg))
-        worker.finished.connect(lambda s, m: self.on_download_finished(row, s, m))
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(lambda: self.cleanup_thread(row))
-        thread.finished.connect(thread.deleteLater)
-        
-        self.download_threads[row] = (thread, worker)
-        thread.start()
+        self.table_model.set_status(row, "下载中...")
+        self.table_model.set_progress(row, 0)
+        self._last_progress.pop(model_id, None)
+
+        task = DownloadTask(model_id, model, self.download_signals, self._mirror_url)
+        self.downloads[model_id] = task
+        self.pool.start(task)
         
         # Update button to "Pause"
         self.update_action_button(row, model)
 
     def stop_download(self, row):
-        if row in self.download_threads:
-            thread, worker = self.download_threads[row]
-            worker.stop()
-            # UI update happens in on_download_finished (triggered by stop usually indirectly or we force it)
-            # Actually, stop() just sets a flag. The thread will finish with success=False.
-            self.table.item(row, 2).setText("正在停止...")
-            btn = self.table.cellWidget(row, 4)
-            btn.setEnabled(False)
-
-    def update_progress(self, row, percent, msg):
-        pbar_widget = self.table.cellWidget(row, 3)
-        if pbar_widget:
-            pbar = pbar_widget.findChild(QProgressBar)
-            if percent >= 0:
-                pbar.setValue(percent)
-            pbar.setToolTip(msg)
-            # Optional: Show text in status column? 
-            # self.table.item(row, 2).setText(msg)
-
-    def on_download_finished(self, row, success, msg):
-        # Note: Do not delete thread ref here to avoid QThread destroyed while running error
-        # It will be cleaned up in cleanup_thread when thread actually finishes
+        task = self.downloads.get(self.model_id(self.model_list[row]))
+        if task:
+            # stop() 只设置标志，任务结束后通过 finished 信号恢复界面
+            task.stop()
+            self.table_model.set_status(row, "正在停止...")
+            btn = self._row_buttons.get(row)
+            if btn:
+                btn.setEnabled(False)
+
+    @pyqtSlot(str, int, str)
+    def update_progress(self, model_id, percent, msg):
+        if self._last_progress.get(model_id) == (percent, msg):
+            return
+        self._last_progress[model_id] = (percent, msg)
+        row = self._row_by_id.get(model_id)
+        if row is None:
+            return
+        if percent >= 0:
+            self.table_model.set_progress(row, percent, msg)
+        else:
+            self.table_model.set_tooltip(row, msg)
+        # Optional: Show text in status column? 
+        # self.table_model.set_status(row, msg)
+
+    @pyqtSlot(str, bool, str)
+    def on_download_finished(self, model_id, success, msg):
+        # 任务的 run() 已返回，可以直接释放引用
+        self.downloads.pop(model_id, None)
+        self._last_progress.pop(model_id, None)
+        row = self._row_by_id.get(model_id)
+        if row is None or self._closing:
+            return
             
         if success:
             self.model_list[row].is_downloaded = True
             self.refresh_row(row)
-            # Use QTimer.singleShot to show message box after a slight delay to allow event loop to process
-            # But direct call is usually fine if we don't delete thread here
             QMessageBox.information(self, "成功", f"模型 {self.model_list[row].name} 下载完成")
         else:
             self.refresh_row(row)
             QMessageBox.critical(self, "错误", f"下载失败: {msg}")
 
-    def cleanup_thread(self, row):
-        if row in self.download_threads:
-            del self.download_threads[row]
-
     def delete_model(self, row):
         model = self.model_list[row]
         reply = QMessageBox.question(self, '确认删除', f"确定要删除模型 {model.name} 吗？\n文件将被永久移除。",
@@ -241,31 +440,30 @@ class ModelManagerDialog(QDialog):
         # Helper to just refresh one row's UI based on current model state
         model = self.model_list[row]
         
-        self.table.item(row, 2).setText("已下载" if model.is_downloaded else "未下载")
-        
-        pbar_widget = self.table.cellWidget(row, 3)
-        pbar = pbar_widget.findChild(QProgressBar)
-        if not self.model_list[row].is_downloaded:
-             pbar.hide()
-             pbar.setValue(0)
-        else:
-             pbar.hide()
+        # 状态恢复为按是否已下载显示，并隐藏进度条
+        self.table_model.set_status(row, None)
+        self.table_model.set_progress(row, -1)
         
         self.update_action_button(row, model)
         
     def closeEvent(self, event):
         # Warn if downloads are active
-        if self.download_threads:
+        if self.downloads:
             reply = QMessageBox.warning(self, "警告", "有正在进行的下载任务，关闭窗口将终止下载。\n确定要关闭吗？",
                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             if reply == QMessageBox.StandardButton.No:
                 event.ignore()
                 return
             
-            # Stop all threads
-            for row, (thread, worker) in self.download_threads.items():
-                worker.stop()
-                thread.quit()
-                thread.wait() # force wait
+            # 先通知所有任务停止，再统一等待；等待期间继续处理绘制等事件，界面不会卡死
+            self._closing = True
+            for task in self.downloads.values():
+                task.stop()
+            deadline = QDeadlineTimer(CLOSE_WAIT_MS)
+            while self.pool.activeThreadCount() and not deadline.hasExpired():
+                QApplication.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents, 50)
+            # 丢弃尚未开始的任务，正在运行的任务最多再等到截止时间为止
+            self.pool.clear()
+            self.pool.waitForDone(max(0, deadline.remainingTime()))
                 
         event.accept()
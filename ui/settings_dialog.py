@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QLineEdit, QPushButton, QFileDialog, QTabWidget, QWidget,
-                             QComboBox, QSpinBox, QCheckBox, QGroupBox, QFormLayout)
+                             QComboBox, QSpinBox, QCheckBox, QGridLayout, QFrame)
 from PyQt6.QtCore import Qt
 from config import LANGUAGES, PROMPT_DEFAULTS
 
+# 所有默认提示词，用于判断当前提示词是否为某个语言的默认值
+_PROMPT_DEFAULT_SET = frozenset(PROMPT_DEFAULTS.values())
+
 class SettingsDialog(QDialog):
     def __init__(self, config_manager, parent=None):
         super().__init__(parent)
@@ -21,95 +24,85 @@ class SettingsDialog(QDialog):
         main_layout.addWidget(self.tabs)
         
         # === 核心设置 Tab ===
+        # 每个 Tab 只用一个 QGridLayout，分组用标题标签和分隔线表示，减少布局嵌套层数
         core_tab = QWidget()
-        core_layout = QVBoxLayout(core_tab)
+        core_grid = QGridLayout(core_tab)
+        core_grid.setColumnStretch(1, 1)
         
         # 模型与语言
-        model_group = QGroupBox("模型与语言")
-        model_form = QFormLayout()
-        
+        row = self._add_section(core_grid, 0, "模型与语言", first=True)
         self.model_combo = QComboBox()
         self.model_combo.addItems(["tiny", "base", "small", "medium", "large-v2", "large-v3"])
         self.model_combo.setToolTip("模型越大精度越高，但速度越慢且占用更多显存。\n推荐: medium 或 large-v2")
-        model_form.addRow("Whisper 模型:", self.model_combo)
+        core_grid.addWidget(QLabel("Whisper 模型:"), row, 0)
+        core_grid.addWidget(self.model_combo, row, 1)
+        row += 1
         
         self.lang_combo = QComboBox()
         # 添加语言列表
         for code, name in LANGUAGES.items():
             self.lang_combo.addItem(name, code)
         self.lang_combo.setToolTip("请务必选择歌曲的主要语言。\nWhisper 对多语言混合的支持有限，请以主歌词语言为准。")
-        self.lang_combo.currentTextChanged.connect(self.on_lang_changed)
-        model_form.addRow("主要语言:", self.lang_combo)
-        
-        model_group.setLayout(model_form)
-        core_layout.addWidget(model_group)
+        self.lang_combo.currentIndexChanged.connect(self.on_lang_changed)
+        core_grid.addWidget(QLabel("主要语言:"), row, 0)
+        core_grid.addWidget(self.lang_combo, row, 1)
+        row += 1
         
         # 提示词
-        prompt_group = QGroupBox("提示词 (Prompt)")
-        prompt_lay = QVBoxLayout()
+        row = self._add_section(core_grid, row, "提示词 (Prompt)")
         self.prompt_edit = QLineEdit()
         self.prompt_edit.setPlaceholderText("例如: 这是一首中文歌曲。")
         self.prompt_edit.setToolTip("提示词可以引导模型更好地识别风格或标点。\n留空则使用默认推荐提示词。")
-        prompt_lay.addWidget(self.prompt_edit)
-        prompt_group.setLayout(prompt_lay)
-        core_layout.addWidget(prompt_group)
+        core_grid.addWidget(self.prompt_edit, row, 0, 1, 2)
+        row += 1
         
         # 偏移
-        offset_group = QGroupBox("时间偏移")
-        offset_lay = QHBoxLayout()
+        row = self._add_section(core_grid, row, "时间偏移")
         self.offset_spin = QSpinBox()
         self.offset_spin.setRange(-10000, 10000)
         self.offset_spin.setSuffix(" ms")
         self.offset_spin.setToolTip("整体调整时间戳。\n正数: 时间延后; 负数: 时间提前。")
-        offset_lay.addWidget(QLabel("全局偏移:"))
-        offset_lay.addWidget(self.offset_spin)
-        offset_lay.addStretch()
-        offset_group.setLayout(offset_lay)
-        core_layout.addWidget(offset_group)
+        core_grid.addWidget(QLabel("全局偏移:"), row, 0)
+        core_grid.addWidget(self.offset_spin, row, 1, Qt.AlignmentFlag.AlignLeft)
+        row += 1
         
-        core_layout.addStretch()
+        core_grid.setRowStretch(row, 1)
         self.tabs.addTab(core_tab, "核心参数")
         
         # === 路径与高级 Tab ===
         path_tab = QWidget()
-        path_layout = QVBoxLayout(path_tab)
+        path_grid = QGridLayout(path_tab)
+        path_grid.setColumnStretch(1, 1)
         
         # 路径设置
-        path_group = QGroupBox("文件路径")
-        path_form = QFormLayout()
-        
-        path_lay1 = QHBoxLayout()
+        row = self._add_section(path_grid, 0, "文件路径", first=True)
         self.model_path_edit = QLineEdit()
         self.model_path_edit.setReadOnly(True)
         btn_model = QPushButton("📂")
         btn_model.clicked.connect(self.browse_model_path)
-        path_lay1.addWidget(self.model_path_edit)
-        path_lay1.addWidget(btn_model)
-        path_form.addRow("模型存放:", path_lay1)
+        path_grid.addWidget(QLabel("模型存放:"), row, 0)
+        path_grid.addWidget(self.model_path_edit, row, 1)
+        path_grid.addWidget(btn_model, row, 2)
+        row += 1
         
-        path_lay2 = QHBoxLayout()
         self.output_path_edit = QLineEdit()
         self.output_path_edit.setReadOnly(True)
         btn_output = QPushButton("📂")
         btn_output.clicked.connect(self.browse_output_path)
-        path_lay2.addWidget(self.output_path_edit)
-        path_lay2.addWidget(btn_output)
-        path_form.addRow("默认保存:", path_lay2)
-        
-        path_group.setLayout(path_form)
-        path_layout.addWidget(path_group)
+        path_grid.addWidget(QLabel("默认保存:"), row, 0)
+        path_grid.addWidget(self.output_path_edit, row, 1)
+        path_grid.addWidget(btn_output, row, 2)
+        row += 1
         
         # 高级选项
-        adv_group = QGroupBox("高级选项")
-        adv_lay = QVBoxLayout()
+        row = self._add_section(path_grid, row, "高级选项")
         self.check_release_vram = QCheckBox("任务结束后释放显存")
         self.check_release_vram.setChecked(True)
         self.check_release_vram.setToolTip("取消勾选可加快连续任务的处理速度，但会长期占用显存。")
-        adv_lay.addWidget(self.check_release_vram)
-        adv_group.setLayout(adv_lay)
-        path_layout.addWidget(adv_group)
+        path_grid.addWidget(self.check_release_vram, row, 0, 1, 3)
+        row += 1
         
-        path_layout.addStretch()
+        path_grid.setRowStretch(row, 1)
         self.tabs.addTab(path_tab, "路径与高级")
 
         # 底部按钮
@@ -123,6 +116,23 @@ class SettingsDialog(QDialog):
         btn_box.addWidget(btn_cancel)
         main_layout.addLayout(btn_box)
 
+    @staticmethod
+    def _add_section(grid, row, title, first=False):
+        """在网格中添加分组标题（非首个分组前加分隔线），返回下一可用行号
+
+        列跨度 -1 表示一直延伸到最右列。
+        """
+        if not first:
+            line = QFrame()
+            line.setFrameShape(QFrame.Shape.HLine)
+            line.setFrameShadow(QFrame.Shadow.Sunken)
+            grid.addWidget(line, row, 0, 1, -1)
+            row += 1
+        label = QLabel(title)
+        label.setStyleSheet("font-weight: bold;")
+        grid.addWidget(label, row, 0, 1, -1)
+        return row + 1
+
     def load_settings(self):
         # Core
         self.model_combo.setCurrentText(self.config_manager.get("MODEL_SIZE", "large-v2"))
@@ -139,15 +149,12 @@ class SettingsDialog(QDialog):
         self.output_path_edit.setText(self.config_manager.get("OUTPUT_DIR", ""))
         self.check_release_vram.setChecked(self.config_manager.get("RELEASE_VRAM", True))
 
-    def on_lang_changed(self, text):
-        lang_code = self.lang_combo.currentData()
+    def on_lang_changed(self, index):
+        if index < 0: return
+        lang_code = self.lang_combo.itemData(index)
         # 如果当前prompt为空或者就是默认的，则自动更新
         current_prompt = self.prompt_edit.text().strip()
-        is_default = False
-        for p in PROMPT_DEFAULTS.values():
-            if current_prompt == p:
-                is_default = True
-                break
+        is_default = current_prompt in _PROMPT_DEFAULT_SET
         
         if not current_prompt or is_default:
             new_default = PROMPT_DEFAULTS.get(lang_code, PROMPT_DEFAULTS["default"])
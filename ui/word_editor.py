@@ -1,12 +1,116 @@
 # -*- coding: utf-8 -*-
 import re
+import bisect
+from array import array
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-                             QComboBox, QTableWidget, QTableWidgetItem, QAbstractItemView)
-from PyQt6.QtCore import Qt, QTimer, QUrl
+                             QComboBox, QTableView, QAbstractItemView, QStyledItemDelegate,
+                             QHeaderView, QTextEdit)
+from PyQt6.QtCore import Qt, QTimer, QUrl, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import (QBrush, QColor, QFont, QFontMetrics, QTextCharFormat, QTextCursor,
+                         QTextBlockFormat)
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 from utils.time_utils import format_ms, parse_time_tag
 
+# 行首时间标签、用于切分的逐字时间标签、判断片段是否为时间标签
+_LEAD_TAG = re.compile(r'^\[\d{2}:\d{2}\.\d{2,3}\]')
+_SPLIT_TAG = re.compile(r'(\[\d{2}:\d{2}\.\d{2,3}\])')
+_IS_TAG = re.compile(r'^\[\d{2}:\d{2}\.\d{2,3}\]$')
+
+# 预览中每个字的显示状态，取值即 _PREVIEW_COLORS 的下标：未唱（灰）、正在唱（绿）、已唱（蓝）
+_PENDING, _ACTIVE, _DONE = 0, 1, 2
+_PREVIEW_COLORS = ("#909399", "#67c23a", "#409eff")
+_PREVIEW_PADDING = 15
+
+# 歌词行的自定义数据角色：返回该字是否已手动修改过时间
+EDITED_ROLE = Qt.ItemDataRole.UserRole + 1
+
+class TokenModel(QAbstractTableModel):
+    """逐字数据模型
+    
+    两行（歌词、时间），每个字占一列，直接读取编辑器的文字、时间、编辑标记三个并行序列，
+    修改后只通知变化的单元格刷新。
+    """
+    HEADERS = ["歌词", "时间"]
+
+    def __init__(self, chars, times, edited, parent=None):
+        super().__init__(parent)
+        self._chars = chars
+        self._times = times
+        self._edited = edited
+        self._char_font = QFont()
+        self._char_font.setPointSize(20)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._chars)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._chars[col] if row == 0 else format_ms(self._times[col])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if row == 0:
+            if role == Qt.ItemDataRole.FontRole:
+                return self._char_font
+            if role == EDITED_ROLE:
+                return bool(self._edited[col])
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Vertical:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def char_font(self):
+        """歌词行使用的字体"""
+        return self._char_font
+
+    def columns_changed(self, first, last):
+        """通知视图 first..last 列的时间、编辑状态或高亮已变化"""
+        self.dataChanged.emit(self.index(0, first), self.index(1, last),
+                              [Qt.ItemDataRole.DisplayRole, EDITED_ROLE])
+
+class TokenDelegate(QStyledItemDelegate):
+    """按高亮列和编辑状态绘制歌词行背景
+
+    背景画刷预先创建并复用，高亮列只保存在委托中，切换时不修改模型数据。
+    """
+    _BRUSH_ACTIVE = QBrush(QColor(Qt.GlobalColor.cyan))
+    _BRUSH_EDITED = QBrush(QColor(Qt.GlobalColor.yellow))
+    _BRUSH_DEFAULT = QBrush(QColor(Qt.GlobalColor.white))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.active_col = -1
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.row() != 0:
+            return
+        if index.column() == self.active_col:
+            option.backgroundBrush = self._BRUSH_ACTIVE
+        elif index.data(EDITED_ROLE):
+            option.backgroundBrush = self._BRUSH_EDITED
+        else:
+            option.backgroundBrush = self._BRUSH_DEFAULT
+
+    def set_active(self, col):
+        """设置高亮列，返回之前的高亮列；由调用方刷新新旧两列"""
+        old = self.active_col
+        self.active_col = col
+        return old
+
 class WordLevelEditor(QDialog):
     """
     字级精细校对窗口 (支持区间播放与自动暂停)
@@ -23,8 +127,34 @@ class WordLevelEditor(QDialog):
         self.result_lrc_content = None
         self.result_start_time = None
         
-        self.tokens = self.parse_line(line_text, start_time_ms)
+        # 逐字数据按列存储：文字列表、时间数组 (ms)、是否手动修改过的标记
+        self._chars, self._times, self._edited = self.parse_line(line_text, start_time_ms)
         self.last_active_idx = -1
+        # 时间修改后需调用 refresh_times() 更新以下查找状态
+        self._times_sorted = True
+        self._cursor = -1
+        self._preview_bounds = []  # 所有字时间与句尾时间排序后的列表，预览颜色只在跨过这些时刻时变化
+        self._preview_key = None  # 上次预览时 pos 在 _preview_bounds 中的位置
+        self._last_pos = -1
+        self._last_shown_cs = -1
+        self._last_scrolled_col = -1
+        self.refresh_times()
+        # 预览中每个字在文档里的位置（UTF-16 偏移，补充平面字符占两个单位）及当前显示状态
+        self._char_pos = []
+        offset = 0
+        for c in self._chars:
+            self._char_pos.append(offset)
+            offset += len(c.encode('utf-16-le')) // 2
+        self._char_pos.append(offset)
+        self._char_state = bytearray(len(self._chars))  # 全部为 _PENDING
+        # 待刷新的列和预览，同一轮事件循环内的多次修改（如按住方向键）合并为一次刷新
+        self._dirty_cols = set()
+        self._dirty_preview = False
+        self._preview_pos = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush_updates)
         
         self.player = QMediaPlayer()
         self.audio_output = QAudioOutput()
@@ -33,14 +163,12 @@ class WordLevelEditor(QDialog):
         self.player.setSource(QUrl.fromLocalFile(audio_path))
         
         # 初始定位到该句开始前 1秒 (稍微留点预卷时间)
-        self.start_pos = max(0, self.tokens[0]['time'] - 1000 if self.tokens else start_time_ms - 1000)
+        self.start_pos = max(0, self._times[0] - 1000 if self._times else start_time_ms - 1000)
         
         self.setup_ui()
         
-        self.timer = QTimer(self)
-        self.timer.setInterval(50)
-        self.timer.timeout.connect(self.sync_highlight)
-        self.timer.start()
+        # 由播放器自身的位置信号驱动高亮，暂停时没有任何唤醒
+        self.player.positionChanged.connect(self.sync_highlight)
 
     def on_media_status_changed(self, status):
         if status == QMediaPlayer.MediaStatus.LoadedMedia or status == QMediaPlayer.MediaStatus.BufferedMedia:
@@ -53,19 +181,24 @@ class WordLevelEditor(QDialog):
             self.update_play_icon()
 
     def parse_line(self, text, default_start):
-        clean_text = re.sub(r'^\[\d{2}:\d{2}\.\d{2,3}\]', '', text)
-        parts = re.split(r'(\[\d{2}:\d{2}\.\d{2,3}\])', clean_text)
-        tokens = []
-        current_time = default_start
+        """拆分逐字歌词行
+
+        Returns:
+            (文字列表, 时间数组, 编辑标记) 三个等长序列
+        """
+        clean_text = _LEAD_TAG.sub('', text)
+        parts = _SPLIT_TAG.split(clean_text)
+        chars = []
+        times = array('q')
+        current_time = int(default_start)
         for part in parts:
             if not part: continue
-            if re.match(r'^\[\d{2}:\d{2}\.\d{2,3}\]$', part):
+            if _IS_TAG.match(part):
                 current_time = parse_time_tag(part)
             else:
-                chars = list(part)
-                for char in chars:
-                    tokens.append({'char': char, 'time': current_time, 'edited': False})
-        return tokens
+                chars.extend(part)
+                times.extend([current_time] * len(part))
+        return chars, times, bytearray(len(chars))
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -78,19 +211,39 @@ class WordLevelEditor(QDialog):
         lbl_hint.setStyleSheet("color: #909399; font-size: 12px;")
         preview_container.addWidget(lbl_hint)
         
-        self.lbl_preview = QLabel()
-        self.lbl_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_preview.setStyleSheet("""
+        # 预览使用常驻的 QTextDocument，播放时只修改颜色变化的字，不重新解析和排版整段富文本
+        self.preview = QTextEdit()
+        self.preview.setReadOnly(True)
+        self.preview.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.preview.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+        self.preview.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.preview.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.preview.setStyleSheet(f"""
             background-color: #303133; 
             border-radius: 8px; 
-            padding: 15px;
+            padding: {_PREVIEW_PADDING}px;
             font-family: 'Microsoft YaHei';
             font-size: 28px;
             font-weight: bold;
         """)
-        self.lbl_preview.setTextFormat(Qt.TextFormat.RichText)
+        self._preview_formats = []
+        for color in _PREVIEW_COLORS:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._preview_formats.append(fmt)
+        
+        doc = self.preview.document()
+        doc.setUndoRedoEnabled(False)
+        cursor = QTextCursor(doc)
+        block_fmt = QTextBlockFormat()
+        block_fmt.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        cursor.setBlockFormat(block_fmt)
+        cursor.insertText("".join(self._chars), self._preview_formats[_PENDING])
+        # 高度随文档内容（换行）调整，不出现滚动条
+        doc.documentLayout().documentSizeChanged.connect(self.fit_preview_height)
+        self.fit_preview_height(doc.size())
         self.update_preview_display(0) # Init
-        preview_container.addWidget(self.lbl_preview)
+        preview_container.addWidget(self.preview)
         
         layout.addLayout(preview_container)
         
@@ -127,34 +280,26 @@ class WordLevelEditor(QDialog):
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus) # 确保对话框本身能接收按键
         
         # 表格控件
-        self.table = QTableWidget()
+        self.token_model = TokenModel(self._chars, self._times, self._edited, self)
+        self.table = QTableView()
+        self.table.setModel(self.token_model)
+        self.token_delegate = TokenDelegate(self.table)
+        self.table.setItemDelegate(self.token_delegate)
         self.table.setFocusPolicy(Qt.FocusPolicy.NoFocus)  # 防止表格抢夺按键焦点
-        self.table.setRowCount(2)
-        self.table.setVerticalHeaderLabels(["歌词", "时间"])
-        self.table.setColumnCount(len(self.tokens))
         self.table.horizontalHeader().setVisible(False)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectColumns)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         
-        for col, token in enumerate(self.tokens):
-            item_char = QTableWidgetItem(token['char'])
-            item_char.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            font = item_char.font()
-            font.setPointSize(20)
-            item_char.setFont(font)
-            self.table.setItem(0, col, item_char)
-            
-            time_str = format_ms(token['time'])
-            item_time = QTableWidgetItem(time_str)
-            item_time.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(1, col, item_time)
+        # 固定行高和列宽，不再按内容逐格计算尺寸
+        vh = self.table.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vh.setDefaultSectionSize(QFontMetrics(self.token_model.char_font()).height() + 12)
+        hh = self.table.horizontalHeader()
+        hh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        hh.setDefaultSectionSize(60)
             
-        self.table.resizeRowsToContents()
-        for i in range(self.table.columnCount()):
-            self.table.setColumnWidth(i, 60)
-            
-        self.table.cellClicked.connect(self.on_cell_clicked)
+        self.table.clicked.connect(self.on_cell_clicked)
         layout.addWidget(self.table)
         
         # 提示信息
@@ -185,7 +330,7 @@ class WordLevelEditor(QDialog):
         btn_box.addWidget(btn_cancel)
         layout.addLayout(btn_box)
         
-        if self.table.columnCount() > 0:
+        if self.token_model.columnCount() > 0:
             self.table.selectColumn(0)
 
     def toggle_play(self):
@@ -210,11 +355,11 @@ class WordLevelEditor(QDialog):
         elif event.key() == Qt.Key.Key_Return or event.key() == Qt.Key.Key_Enter:
             self.stamp_current_char()
         elif event.key() == Qt.Key.Key_Left:
-            curr = self.table.currentColumn()
+            curr = self.table.currentIndex().column()
             if curr > 0: self.table.selectColumn(curr - 1)
         elif event.key() == Qt.Key.Key_Right:
-            curr = self.table.currentColumn()
-            if curr < self.table.columnCount() - 1: self.table.selectColumn(curr + 1)
+            curr = self.table.currentIndex().column()
+            if curr < self.token_model.columnCount() - 1: self.table.selectColumn(curr + 1)
         elif event.key() == Qt.Key.Key_Up:
             self.adjust_timestamp(50)
         elif event.key() == Qt.Key.Key_Down:
@@ -223,107 +368,191 @@ class WordLevelEditor(QDialog):
             super().keyPressEvent(event)
 
     def adjust_timestamp(self, delta_ms):
-        curr = self.table.currentColumn()
+        curr = self.table.currentIndex().column()
         if curr < 0: return
         
-        old_time = self.tokens[curr]['time']
-        new_time = max(0, old_time + delta_ms)
-        self.tokens[curr]['time'] = new_time
-        self.tokens[curr]['edited'] = True
-        
-        self.table.item(1, curr).setText(format_ms(new_time))
-        self.update_cell_color(curr, is_active=True)
+        new_time = max(0, self._times[curr] + delta_ms)
+        self._times[curr] = new_time
+        self._edited[curr] = 1
+        self.refresh_times()
         
-        # Update preview immediately
-        self.update_preview_display(self.player.position())
+        self._dirty_cols.add(curr)
+        self.set_active_col(curr)
+        self.request_preview(self.player.position())
+        self._flush_timer.start()
 
     def update_preview_display(self, current_pos):
-        # 构建富文本
-        html = ""
-        
         # 未播放颜色 #909399 (灰色), 已播放颜色 #409eff (蓝色), 当前字 #67c23a (绿色)
-        for i, token in enumerate(self.tokens):
-            t = token['time']
-            char = token['char']
-            
-            # 判断状态
-            # 下一个字的时间
-            next_t = self.tokens[i+1]['time'] if i < len(self.tokens)-1 else self.end_time_ms
-            
-            if current_pos >= next_t:
-                # 已经完全唱完的字
-                color = "#409eff" # Blue
-            elif current_pos >= t:
-                # 正在唱的字
-                color = "#67c23a" # Green (Active)
+        n = len(self._chars)
+        times = self._times
+        
+        if self._times_sorted:
+            # 时间有序：当前字之前全部唱完，之后全部未唱
+            idx = self.active_index(current_pos)
+            if idx < 0:
+                states = bytearray(n)
             else:
-                # 还没唱到的字
-                color = "#909399" # Gray
-            
-            html += f"<span style='color:{color};'>{char}</span>"
-            
-        self.lbl_preview.setText(html)
+                states = bytearray([_DONE]) * idx + bytearray([_ACTIVE]) + bytearray(n - idx - 1)
+            # 最后一个字以句尾时间为界，过了句尾即算唱完
+            if n and current_pos >= self.end_time_ms:
+                states[-1] = _DONE
+        else:
+            states = bytearray(n)
+            for i in range(n):
+                # 下一个字的时间
+                next_t = times[i + 1] if i < n - 1 else self.end_time_ms
+                if current_pos >= next_t:
+                    states[i] = _DONE     # 已经完全唱完的字
+                elif current_pos >= times[i]:
+                    states[i] = _ACTIVE   # 正在唱的字
+        
+        if states == self._char_state:
+            return
+        # 只重新设置状态变化的字的格式
+        cursor = QTextCursor(self.preview.document())
+        cursor.beginEditBlock()
+        pos = self._char_pos
+        formats = self._preview_formats
+        for i, (old, new) in enumerate(zip(self._char_state, states)):
+            if old != new:
+                cursor.setPosition(pos[i])
+                cursor.setPosition(pos[i + 1], QTextCursor.MoveMode.KeepAnchor)
+                cursor.setCharFormat(formats[new])
+        cursor.endEditBlock()
+        self._char_state = states
+
+    def fit_preview_height(self, size):
+        # 文档高度已包含文档边距，再加上样式表内边距和边框
+        extra = 2 * (_PREVIEW_PADDING + self.preview.frameWidth())
+        self.preview.setFixedHeight(int(size.height()) + extra)
 
     def stamp_current_char(self):
-        curr_col = self.table.currentColumn()
+        curr_col = self.table.currentIndex().column()
         if curr_col < 0: return
         
         current_pos = self.player.position()
-        self.tokens[curr_col]['time'] = current_pos
-        self.tokens[curr_col]['edited'] = True
+        self._times[curr_col] = current_pos
+        self._edited[curr_col] = 1
+        self.refresh_times()
         
-        self.table.item(1, curr_col).setText(format_ms(current_pos))
-        self.update_cell_color(curr_col, is_active=True)
+        self._dirty_cols.add(curr_col)
+        self.set_active_col(curr_col)
+        self._flush_timer.start()
         
-        if curr_col < self.table.columnCount() - 1:
+        if curr_col < self.token_model.columnCount() - 1:
             self.table.selectColumn(curr_col + 1)
 
-    def sync_highlight(self):
+    def refresh_times(self):
+        """时间修改后更新查找状态，并记录是否按时间非递减排列（手动微调后可能乱序）"""
+        times = self._times
+        self._times_sorted = all(times[i] <= times[i + 1] for i in range(len(times) - 1))
+        self._preview_bounds = sorted(times)
+        bisect.insort(self._preview_bounds, self.end_time_ms)
+        self._cursor = -1
+        self._preview_key = None
+        self._last_pos = -1
+
+    def active_index(self, pos):
+        """返回 pos 时刻正在唱的字：从头开始时间不晚于 pos 的连续字中的最后一个，没有则为 -1"""
+        times = self._times
+        if not self._times_sorted:
+            active_idx = -1
+            for i, t in enumerate(times):
+                if pos >= t:
+                    active_idx = i
+                else:
+                    break
+            return active_idx
+        
+        # 时间有序时，正常播放通常停留在上次的字或只前进一个字，其余情况（跳转/重播）二分查找
+        c = self._cursor
+        n = len(times)
+        if c + 1 < n and times[c + 1] <= pos:
+            if c + 2 >= n or times[c + 2] > pos:
+                c += 1
+            else:
+                c = bisect.bisect_right(times, pos) - 1
+        elif c >= 0 and pos < times[c]:
+            c = bisect.bisect_right(times, pos) - 1
+        self._cursor = c
+        return c
+
+    def sync_highlight(self, pos):
         if self.player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
             return
             
-        pos = self.player.position()
-        self.lbl_time.setText(format_ms(pos))
-        
-        # 更新卡拉OK预览
-        self.update_preview_display(pos)
+        # 位置没有变化时无需任何更新
+        if pos == self._last_pos:
+            return
+        self._last_pos = pos
+        # 时间标签精确到 10ms 刷新即可
+        cs = pos // 10
+        if cs != self._last_shown_cs:
+            self._last_shown_cs = cs
+            self.lbl_time.setText(format_ms(pos))
+        active_idx = self.active_index(pos)
+        
+        # 更新卡拉OK预览：每个字的颜色只取决于 pos 与各字时间、句尾时间的先后关系，
+        # 只有跨过其中某个时刻时才重新生成
+        key = bisect.bisect_right(self._preview_bounds, pos)
+        if key != self._preview_key:
+            self._preview_key = key
+            self.request_preview(pos)
         
         # === 核心逻辑：超过本句结束时间自动暂停 ===
         # 允许超过 200ms 的缓冲，避免听到下一句的头
         if pos >= self.end_time_ms + 200:
             self.player.pause()
             self.update_play_icon()
+            self.flush_updates()
             return
         # ======================================
         
-        active_idx = -1
-        for i, token in enumerate(self.tokens):
-            if pos >= token['time']:
-                active_idx = i
-            else:
-                break
-        
         if active_idx != self.last_active_idx:
-            if self.last_active_idx >= 0 and self.last_active_idx < self.table.columnCount():
-                self.update_cell_color(self.last_active_idx, is_active=False)
-            
-            if active_idx >= 0 and active_idx < self.table.columnCount():
-                self.update_cell_color(active_idx, is_active=True)
-                self.table.scrollToItem(self.table.item(0, active_idx))
+            if 0 <= active_idx < self.token_model.columnCount():
+                self.set_active_col(active_idx)
+                self.scroll_to_col(active_idx)
+            else:
+                self.set_active_col(-1)
             
             self.last_active_idx = active_idx
+        
+        # 每次位置更新只提交一次界面更新
+        self.flush_updates()
 
-    def update_cell_color(self, col, is_active):
-        token = self.tokens[col]
-        item = self.table.item(0, col)
-        if not item: return
+    def scroll_to_col(self, col):
+        # 播放时当前字通常只前进一格且仍在可见区域内，此时不触发滚动计算
+        if col == self._last_scrolled_col:
+            return
+        self._last_scrolled_col = col
+        index = self.token_model.index(0, col)
+        if not self.table.viewport().rect().contains(self.table.visualRect(index)):
+            self.table.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
 
-        if is_active: bg = Qt.GlobalColor.cyan
-        elif token['edited']: bg = Qt.GlobalColor.yellow
-        else: bg = Qt.GlobalColor.white
-            
-        if item.background().color() != bg:
-            item.setBackground(bg)
+    def set_active_col(self, col):
+        # 背景色由 TokenDelegate 绘制，这里只记录新旧两列待刷新
+        old = self.token_delegate.set_active(col)
+        if old == col:
+            return
+        if old >= 0:
+            self._dirty_cols.add(old)
+        if col >= 0:
+            self._dirty_cols.add(col)
+
+    def request_preview(self, pos):
+        """标记预览需要按 pos 重新生成，实际刷新在 flush_updates 中进行"""
+        self._preview_pos = pos
+        self._dirty_preview = True
+
+    def flush_updates(self):
+        """一次性提交积累的表格和预览变化"""
+        self._flush_timer.stop()
+        if self._dirty_cols:
+            self.token_model.columns_changed(min(self._dirty_cols), max(self._dirty_cols))
+            self._dirty_cols.clear()
+        if self._dirty_preview:
+            self._dirty_preview = False
+            self.update_preview_display(self._preview_pos)
 
     def update_play_icon(self):
         # 简单的图标更新
@@ -332,29 +561,39 @@ class WordLevelEditor(QDialog):
         else:
             self.btn_play.setText("播放 (Space)")
 
-    def on_cell_clicked(self, row, col):
-        time_ms = self.tokens[col]['time']
+    def on_cell_clicked(self, index):
+        time_ms = self._times[index.column()]
         self.player.setPosition(time_ms)
         if self.player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
             self.player.play()
 
-    def reject(self):
+    def stop_and_release(self):
+        # 断开位置信号，避免对话框关闭后仍在刷新预览
+        try:
+            self.player.positionChanged.disconnect(self.sync_highlight)
+        except TypeError:
+            pass
         self.player.stop()
+
+    def reject(self):
+        self.stop_and_release()
         super().reject()
 
     def closeEvent(self, event):
-        self.player.stop()
+        self.stop_and_release()
         super().closeEvent(event)
 
     def save_and_close(self):
-        content_str = ""
-        first_time_str = f"[{format_ms(self.tokens[0]['time'])}]"
-        for i, token in enumerate(self.tokens):
-            t_str = f"[{format_ms(token['time'])}]"
-            if i == 0: content_str += token['char']
-            else: content_str += f"{t_str}{token['char']}"
-        
-        self.result_lrc_content = content_str
+        chars = self._chars
+        time_strs = [format_ms(t) for t in self._times]
+        first_time_str = f"[{time_strs[0]}]"
+        # 第一个字的时间作为行首标签单独返回，其余每个字前加逐字时间标签
+        parts = [chars[0]]
+        append = parts.append
+        for i in range(1, len(chars)):
+            append(f"[{time_strs[i]}]{chars[i]}")
+        
+        self.result_lrc_content = "".join(parts)
         self.result_start_time = first_time_str
-        self.player.stop()
+        self.stop_and_release()
         self.accept()
@@ -4,6 +4,10 @@ import logging
 import os
 import sys
 from logging.handlers import RotatingFileHandler
+from typing import Dict
+
+# 已配置好的日志记录器，同名再次调用 setup_logger 时直接返回，不再访问文件系统
+_LOGGERS: Dict[str, logging.Logger] = {}
 
 
 def setup_logger(name="AutoKaraoke", level=logging.INFO):
@@ -16,10 +20,15 @@ def setup_logger(name="AutoKaraoke", level=logging.INFO):
     Returns:
         配置好的 logger 实例
     """
+    cached = _LOGGERS.get(name)
+    if cached is not None:
+        return cached
+
     logger = logging.getLogger(name)
     
     # 防止重复添加 handler
     if logger.handlers:
+        _LOGGERS[name] = logger
         return logger
     
     logger.setLevel(logging.DEBUG)
@@ -55,6 +64,7 @@ def setup_logger(name="AutoKaraoke", level=logging.INFO):
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
     
+    _LOGGERS[name] = logger
     return logger
 
 
@@ -67,4 +77,7 @@ def get_logger(name="AutoKaraoke"):
     Returns:
         logger 实例
     """
+    cached = _LOGGERS.get(name)
+    if cached is not None:
+        return cached
     return logging.getLogger(name)
@@ -1,27 +1,48 @@
 # -*- coding: utf-8 -*-
 """时间格式化工具模块"""
+import re
 from functools import lru_cache
 
 
+# 预先格式化的分、秒、毫秒字符串，format_ms 直接查表拼接
+_MM = tuple(f"{i:02d}" for i in range(100))
+_SS = tuple(f"{i:02d}" for i in range(60))
+_MS = tuple(f"{i:03d}" for i in range(1000))
+
+# 时间标签 [mm:ss.xx]，方括号可省略，小数分隔符支持 . 和 :
+_TAG_RE = re.compile(r'\[?(\d+):(\d+)(?:[.:](\d*))?\]?$')
+
+
 def format_ms(ms: float) -> str:
     """格式化毫秒为 mm:ss.mmm
     
+    先取整再查缓存，缓存键均为整数毫秒。
+    
     Args:
         ms: 毫秒数
         
     Returns:
         格式化的时间字符串
     """
-    seconds = ms / 1000.0
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
-    milliseconds = int((seconds % 1) * 1000)
-    return f"{minutes:02d}:{secs:02d}.{milliseconds:03d}"
+    return _format_int_ms(int(ms))
+
 
+@lru_cache(maxsize=4096)
+def _format_int_ms(ms: int) -> str:
+    """format_ms 的带缓存实现，使用整数运算和预格式化字符串表"""
+    minutes, rem = divmod(ms, 60000)
+    secs, millis = divmod(rem, 1000)
+    mm = _MM[minutes] if 0 <= minutes < 100 else f"{minutes:02d}"
+    return mm + ":" + _SS[secs] + "." + _MS[millis]
 
+
+@lru_cache(maxsize=32768)
 def parse_time_tag(tag: str) -> int:
     """解析 [mm:ss.xx] 或 [mm:ss:xx] 格式为毫秒
     
+    此函数使用LRU缓存，编辑器中反复解析相同的时间标签时直接命中缓存。
+    只用一次正则匹配和整数运算，小数部分按毫秒截断，没有浮点误差。
+    
     Args:
         tag: 时间标签字符串，如 [01:23.45]
         
@@ -31,26 +52,13 @@ def parse_time_tag(tag: str) -> int:
     if not tag:
         return -1
         
-    try:
-        # 移除方括号
-        clean = tag.strip("[]")
-        
-        # 分割分:秒
-        parts = clean.split(':')
-        if len(parts) != 2:
-            return -1
-            
-        minutes = int(parts[0])
-        # 处理秒和毫秒（支持 . 和 : 两种分隔符）
-        seconds_str = parts[1].replace(':', '.')
-        seconds = float(seconds_str)
-        
-        # 转换为毫秒
-        total_ms = int((minutes * 60 + seconds) * 1000)
-        return max(0, total_ms)  # 确保非负
-        
-    except (ValueError, IndexError, AttributeError):
+    m = _TAG_RE.match(tag)
+    if not m:
         return -1
+    minutes, seconds, frac = m.groups()
+    # 小数部分补齐/截断到 3 位即为毫秒：.5 -> 500, .45 -> 450, .1234 -> 123
+    millis = int(frac[:3].ljust(3, '0')) if frac else 0
+    return (int(minutes) * 60 + int(seconds)) * 1000 + millis
 
 
 @lru_cache(maxsize=1024)